@@ -1,11 +1,16 @@
 """Configuration management for ADK Chat Service using Pydantic Settings."""
 
 import json
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Valid Python logging levels, hoisted so validation does a single O(1) lookup.
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_LEVELS_SORTED = tuple(sorted(_VALID_LOG_LEVELS))
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -32,13 +37,22 @@ class Settings(BaseSettings):
     )
 
     # Server Configuration
+    debug: bool = Field(
+        default=False,
+        description="Enable development mode (hot reload, file watcher)"
+    )
     host: str = Field(default="0.0.0.0", description="Server host address")
     port: int = Field(default=8000, ge=1, le=65535, description="Server port")
-    cors_origins: list[str] = Field(
-        default=["http://localhost:*", "http://127.0.0.1:*"],
+    cors_origins: tuple[str, ...] = Field(
+        default=("http://localhost:*", "http://127.0.0.1:*"),
         description="Allowed CORS origins"
     )
 
+    enable_docs: bool = Field(
+        default=True,
+        description="Serve /docs, /redoc and /openapi.json (disable in production)"
+    )
+
     # Logging Configuration
     log_level: str = Field(
         default="INFO",
@@ -46,6 +60,21 @@ class Settings(BaseSettings):
     )
     log_file: Optional[str] = Field(default=None, description="Optional log file path")
 
+    # Semantic response cache
+    enable_semantic_cache: bool = Field(
+        default=False,
+        description=(
+            "Replay cached replies for semantically equivalent messages "
+            "within a session (opt-in: replays skip a fresh generation)"
+        )
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.87,
+        ge=0.0,
+        le=1.0,
+        description="Cosine-similarity threshold for semantic cache hits"
+    )
+
     # MCP Tools (Phase 2)
     enable_tools: bool = Field(
         default=False,
@@ -60,16 +89,18 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # The settings object is a cached singleton; freezing it lets
+        # Pydantic skip setattr guards and prevents accidental mutation
+        frozen=True,
     )
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is a valid Python logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {_VALID_LOG_LEVELS_SORTED}")
         return v_upper
 
     @field_validator("cors_origins", mode="before")
@@ -77,20 +108,24 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list."""
         if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [origin.strip() for origin in v.split(",")]
+            # Only hand off to the JSON parser when the value looks like a
+            # JSON array; plain comma-separated values take the cheap path.
+            # A bare JSON string literal must not be tuple-ized — tuple()
+            # over a str yields its characters — so anything that doesn't
+            # decode to a list falls through to the CSV branch.
+            if v.lstrip()[:1] == "[":
+                try:
+                    parsed = json.loads(v)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    if isinstance(parsed, list):
+                        return tuple(parsed)
+            return tuple(origin.strip() for origin in v.split(",") if origin.strip())
         return v
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get the global settings instance (cached after first call)."""
+    return Settings()
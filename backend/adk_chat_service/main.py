@@ -1,18 +1,27 @@
 """FastAPI application for ADK Chat Service."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from . import __version__
 from .config import get_settings
 from .middleware.cors import setup_cors
 from .routes import chat, websocket
-from .services.adk_client import ADKChatClient, set_adk_client
 from .utils.exceptions import BackendError
 from .utils.logger import get_logger, setup_logging
 
+# Prefer uvloop for the per-token streaming workload; Linux-only, so fall
+# back silently to the default selector loop elsewhere
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Initialize settings
 settings = get_settings()
 
@@ -32,11 +41,34 @@ async def lifespan(app: FastAPI):
     logger.info("Starting ADK Chat Service", version=__version__)
 
     try:
-        # Initialize ADK client
+        # Import here so the ADK stack loads at startup, not module import
+        from .services.adk_client import ADKChatClient, set_adk_client
+        from .services.kit_connection import get_kit_manager
+        from .services.session_manager import get_session_manager
+
         adk_client = ADKChatClient(settings)
-        await adk_client.initialize()
+
+        async def warm_managers():
+            # Instantiate the shared managers before the first request/WS hits
+            get_session_manager()
+            get_kit_manager()
+
+        # Overlap ADK initialization with manager warmup so cold start pays
+        # max() rather than sum() of the individual times
+        results = await asyncio.gather(
+            adk_client.initialize(),
+            warm_managers(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
         set_adk_client(adk_client)
 
+        # Expose on app.state so hot handlers can skip the DI resolver
+        app.state.adk_client = adk_client
+
         logger.info("ADK Chat Service started successfully")
         yield
 
@@ -65,9 +97,10 @@ app = FastAPI(
     description="FastAPI backend for Google ADK chat integration with MCP extensibility",
     version=__version__,
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+    default_response_class=ORJSONResponse
 )
 
 # Setup CORS middleware
@@ -77,6 +110,11 @@ setup_cors(app, settings)
 app.include_router(chat.router)
 app.include_router(websocket.router)
 
+# Materialize the OpenAPI schema once so the first /docs or /openapi.json
+# request doesn't pay the schema-generation cost
+if settings.enable_docs:
+    app.openapi()
+
 
 @app.exception_handler(BackendError)
 async def backend_error_handler(request: Request, exc: BackendError):
@@ -92,13 +130,15 @@ async def backend_error_handler(request: Request, exc: BackendError):
         path=request.url.path
     )
 
-    return JSONResponse(
+    # Splice the dynamic fields onto the per-class prebuilt '{"error":...,'
+    # prefix so only message/detail are serialized per error
+    body = exc._json_prefix + orjson.dumps(
+        {"message": exc.message, "detail": exc.detail}
+    )[1:]
+    return Response(
+        content=body,
         status_code=500,
-        content={
-            "error": exc.__class__.__name__,
-            "message": exc.message,
-            "detail": exc.detail
-        }
+        media_type="application/json"
     )
 
 
@@ -122,10 +162,24 @@ async def ping():
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop cuts asyncio overhead for the socket-heavy NDJSON streaming
+    # workload, but it isn't available everywhere (notably Windows); fall
+    # back to the stdlib loop rather than failing at startup
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+
     uvicorn.run(
         "adk_chat_service.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
-        log_level=settings.log_level.lower()
+        # Hot reload spawns a file-watcher subprocess; only pay for it in dev
+        reload=settings.debug,
+        log_level=settings.log_level.lower(),
+        loop=loop_impl,
+        # httptools (bundled with uvicorn[standard]) speeds up HTTP parsing
+        http="httptools",
+        ws="websockets"
     )
@@ -10,6 +10,16 @@ from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Common localhost origins substituted for wildcard patterns during development.
+_LOCAL_DEV_ORIGINS = (
+    "http://localhost:8000",
+    "http://localhost:8080",
+    "http://localhost:3000",
+    "http://127.0.0.1:8000",
+    "http://127.0.0.1:8080",
+    "http://127.0.0.1:3000",
+)
+
 
 def setup_cors(app: FastAPI, settings: Settings) -> None:
     """
@@ -30,22 +40,18 @@ def setup_cors(app: FastAPI, settings: Settings) -> None:
     # FastAPI CORSMiddleware doesn't support wildcards in port numbers
     # For local development, we allow all localhost ports
     origins = []
+    seen_wildcard = False
     for origin in settings.cors_origins:
         if "*" in origin:
-            # For development, allow common localhost patterns
-            origins.extend([
-                "http://localhost:8000",
-                "http://localhost:8080",
-                "http://localhost:3000",
-                "http://127.0.0.1:8000",
-                "http://127.0.0.1:8080",
-                "http://127.0.0.1:3000",
-            ])
+            # For development, allow common localhost patterns (once)
+            if not seen_wildcard:
+                origins.extend(_LOCAL_DEV_ORIGINS)
+                seen_wildcard = True
         else:
             origins.append(origin)
 
-    # Remove duplicates
-    origins = list(set(origins))
+    # Remove duplicates while preserving order
+    origins = list(dict.fromkeys(origins))
 
     logger.info("Configuring CORS", origins=origins)
 
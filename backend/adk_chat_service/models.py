@@ -1,11 +1,16 @@
 """Pydantic models for request/response validation."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
 
+def _utc_now() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow."""
+    return datetime.now(timezone.utc)
+
+
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
 
@@ -77,7 +82,7 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type or category")
     detail: Optional[str] = Field(default=None, description="Detailed error message")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utc_now,
         description="Timestamp when error occurred"
     )
 
@@ -102,7 +107,7 @@ class HealthResponse(BaseModel):
     adk_ready: bool = Field(..., description="Whether ADK client is initialized")
     kit_connected: bool = Field(default=False, description="Whether Kit extension is connected")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utc_now,
         description="Timestamp of health check"
     )
 
@@ -1,26 +1,53 @@
 """Chat endpoint for streaming LLM responses."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from .. import __version__
+from ..config import get_settings
 from ..models import ChatRequest, HealthResponse
-from ..services.adk_client import ADKChatClient, get_adk_client
 from ..services.kit_connection import get_kit_manager
-from ..services.stream_handler import format_stream_as_ndjson, format_tool_stream_as_ndjson
-from ..utils.exceptions import ADKClientError, StreamingError
+from ..services.stream_handler import (
+    coalesce_stream,
+    format_stream_as_ndjson,
+    format_tool_stream_as_ndjson,
+)
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..services.adk_client import ADKChatClient
+
 logger = get_logger()
 
+
+def _resolve_adk_client() -> "ADKChatClient":
+    """Dependency shim that defers the ADK import to request time.
+
+    Importing adk_client at module scope would pull the whole Google ADK
+    stack in before the app can serve anything.
+    """
+    from ..services.adk_client import get_adk_client
+    return get_adk_client()
+
 router = APIRouter(prefix="/api/v1", tags=["chat"])
 
+# Frozen header dict for streaming responses; FastAPI copies it per response
+_NDJSON_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Content-Type-Options": "nosniff"
+}
+
+# Health payload templates keyed on (adk_ready, kit_connected); the status
+# tuple changes rarely, so liveness probes skip Pydantic construction
+_HEALTH_CACHE: Dict[Tuple[bool, bool], Dict] = {}
+
 
 @router.post("/chat/stream")
-async def stream_chat(
-    request: ChatRequest,
-    adk_client: ADKChatClient = Depends(get_adk_client)
-) -> StreamingResponse:
+async def stream_chat(request: ChatRequest, req: Request) -> StreamingResponse:
     """
     Stream chat responses from Google ADK.
 
@@ -29,23 +56,28 @@ async def stream_chat(
 
     Args:
         request: Chat request with message and optional parameters
-        adk_client: ADK client instance (injected)
+        req: Raw HTTP request, used to reach the shared ADK client
 
     Returns:
         StreamingResponse with NDJSON content
 
     Raises:
-        HTTPException: If streaming fails
+        BackendError: Converted to a JSON 500 by the app-wide handler
     """
-    try:
-        logger.info(
-            "Received chat request",
-            message_length=len(request.message),
-            conversation_id=request.conversation_id,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens
-        )
-
+    # Read the singleton off app.state instead of paying the DI resolver
+    adk_client: "ADKChatClient" = req.app.state.adk_client
+
+    logger.info(
+        "Received chat request",
+        message_length=len(request.message),
+        conversation_id=request.conversation_id,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens
+    )
+
+    # ADKClientError/StreamingError raised here propagate to the app-wide
+    # BackendError handler in main.py, keeping this path free of try frames
+    if get_settings().enable_tools:
         # Get tool-enabled stream from ADK client
         event_stream = adk_client.stream_chat_with_tools(
             message=request.message,
@@ -59,74 +91,55 @@ async def stream_chat(
             event_stream,
             conversation_id=request.conversation_id
         )
-
-        # Return streaming response
-        return StreamingResponse(
-            ndjson_stream,
-            media_type="application/x-ndjson",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Content-Type-Options": "nosniff"
-            }
-        )
-
-    except ADKClientError as e:
-        logger.error(
-            "ADK client error",
-            error=e.message,
-            detail=e.detail,
+    else:
+        # Text-only stream
+        text_stream = adk_client.stream_chat(
+            message=request.message,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
             conversation_id=request.conversation_id
         )
-        raise HTTPException(
-            status_code=500,
-            detail=f"ADK client error: {e.message}"
-        )
-
-    except StreamingError as e:
-        logger.error(
-            "Streaming error",
-            error=e.message,
-            detail=e.detail,
+        ndjson_stream = format_stream_as_ndjson(
+            text_stream,
             conversation_id=request.conversation_id
         )
-        raise HTTPException(
-            status_code=500,
-            detail=f"Streaming error: {e.message}"
-        )
 
-    except Exception as e:
-        logger.error(
-            "Unexpected error in chat endpoint",
-            error=str(e),
-            conversation_id=request.conversation_id
-        )
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error"
-        )
+    # Return streaming response; coalescing pre-encodes to bytes and batches
+    # tiny chunks so Starlette issues fewer socket writes
+    return StreamingResponse(
+        coalesce_stream(ndjson_stream),
+        media_type="application/x-ndjson",
+        headers=_NDJSON_HEADERS
+    )
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(
-    adk_client: ADKChatClient = Depends(get_adk_client)
-) -> HealthResponse:
+async def health_check(adk_client=Depends(_resolve_adk_client)) -> ORJSONResponse:
     """
     Health check endpoint.
 
-    Returns service status and whether ADK client is ready.
+    Returns service status and whether ADK client is ready. Payloads are
+    cached per (adk_ready, kit_connected) state so frequent liveness probes
+    skip model construction; only the timestamp is computed per call.
 
     Args:
         adk_client: ADK client instance (injected)
 
     Returns:
-        HealthResponse with service status
+        HealthResponse-shaped JSON with service status
     """
     try:
         adk_ready = adk_client.is_ready
         kit_manager = get_kit_manager()
         kit_connected = kit_manager.is_connected
 
+    except Exception as e:
+        logger.error("Health check failed", error=str(e))
+        adk_ready = False
+        kit_connected = False
+
+    template = _HEALTH_CACHE.get((adk_ready, kit_connected))
+    if template is None:
         # Determine overall status
         if adk_ready and kit_connected:
             status = "healthy"
@@ -135,18 +148,14 @@ async def health_check(
         else:
             status = "unhealthy"
 
-        return HealthResponse(
-            status=status,
-            version=__version__,
-            adk_ready=adk_ready,
-            kit_connected=kit_connected
-        )
-
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
-        return HealthResponse(
-            status="unhealthy",
-            version=__version__,
-            adk_ready=False,
-            kit_connected=False
-        )
+        template = {
+            "status": status,
+            "version": __version__,
+            "adk_ready": adk_ready,
+            "kit_connected": kit_connected
+        }
+        _HEALTH_CACHE[(adk_ready, kit_connected)] = template
+
+    payload = dict(template)
+    payload["timestamp"] = datetime.now(timezone.utc)
+    return ORJSONResponse(payload)
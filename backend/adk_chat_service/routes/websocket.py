@@ -24,9 +24,13 @@ async def websocket_tools_endpoint(websocket: WebSocket):
     """
     kit_manager = get_kit_manager()
 
+    # Local aliases avoid repeated global + attribute lookups in the hot path
+    log_info = logger.info
+    log_error = logger.error
+
     # Accept connection
     await websocket.accept()
-    logger.info("WebSocket connection accepted", client=websocket.client)
+    log_info("WebSocket connection accepted", client=websocket.client)
 
     # Register connection
     await kit_manager.register_connection(websocket)
@@ -34,14 +38,26 @@ async def websocket_tools_endpoint(websocket: WebSocket):
     try:
         # Message loop
         while True:
-            message = await websocket.receive_text()
+            # Kit sends binary frames (pre-serialized JSON bytes), so read
+            # raw ASGI messages instead of receive_text(); handle_message
+            # accepts both str and bytes payloads.
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code") or 1000)
+            message = frame.get("bytes")
+            if message is None:
+                message = frame["text"]
+
+            # No receive-side batching here: the Kit writer already
+            # coalesces bursts into newline-joined frames, which
+            # handle_message splits and dispatches in one pass.
             await kit_manager.handle_message(message)
 
     except WebSocketDisconnect:
-        logger.info("Kit disconnected normally")
+        log_info("Kit disconnected normally")
 
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        log_error(f"WebSocket error: {e}")
 
     finally:
         await kit_manager.unregister_connection()
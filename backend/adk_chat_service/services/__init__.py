@@ -1,20 +1,34 @@
-"""Service layer for ADK Chat Service."""
+"""Service layer for ADK Chat Service.
 
-from .adk_client import ADKChatClient, get_adk_client, set_adk_client
-from .session_manager import SessionManager, get_session_manager, set_session_manager
-from .adk_agent import OmniverseAgent, get_omniverse_agent, create_omniverse_agent
-from .kit_connection import KitConnectionManager, get_kit_manager
+Submodules pull in the Google ADK and websocket stacks, so re-exports are
+resolved lazily (PEP 562) to keep application import time low.
+"""
 
-__all__ = [
-    "ADKChatClient",
-    "get_adk_client",
-    "set_adk_client",
-    "SessionManager",
-    "get_session_manager",
-    "set_session_manager",
-    "OmniverseAgent",
-    "get_omniverse_agent",
-    "create_omniverse_agent",
-    "KitConnectionManager",
-    "get_kit_manager",
-]
+from importlib import import_module
+
+_EXPORTS = {
+    "ADKChatClient": ".adk_client",
+    "get_adk_client": ".adk_client",
+    "set_adk_client": ".adk_client",
+    "SessionManager": ".session_manager",
+    "get_session_manager": ".session_manager",
+    "set_session_manager": ".session_manager",
+    "OmniverseAgent": ".adk_agent",
+    "get_omniverse_agent": ".adk_agent",
+    "create_omniverse_agent": ".adk_agent",
+    "KitConnectionManager": ".kit_connection",
+    "get_kit_manager": ".kit_connection",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import service symbols on first access instead of at package import."""
+    try:
+        module = import_module(_EXPORTS[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -6,43 +6,87 @@ the Runner for handling conversations with session context.
 """
 
 import asyncio
-from textwrap import dedent
-from typing import Optional, AsyncGenerator, Dict, Any
+import logging
+from collections import OrderedDict
+from typing import Optional, AsyncGenerator, Dict, Any, List, Tuple
 
 from google.adk.agents import Agent
+from google.adk.events import Event
 from google.adk.runners import Runner
 from google.genai import types
 
 from ..config import Settings
 from ..utils.logger import get_logger
+from .semantic_cache import SemanticCache
 from .session_manager import get_session_manager, SessionManager
 from ..tools.usd_tools import USD_TOOLS
 
 logger = get_logger()
 
+# Checked at call time — this module is imported (via the route imports in
+# main) before setup_logging runs, so a value captured here would freeze
+# the pre-configuration level. isEnabledFor caches per level, keeping the
+# guard on per-turn kwarg formatting cheap.
+_is_enabled = logging.getLogger().isEnabledFor
+_INFO = logging.INFO
 
-# System instruction for the Omniverse assistant
-SYSTEM_INSTRUCTION = dedent("""\
-    You are an intelligent assistant for NVIDIA Omniverse, helping users work with 3D scenes and USD (Universal Scene Description) content.
+# Constructor bindings for the per-turn message wrapper; module-level names
+# keep the hot path to two LOAD_GLOBALs instead of attribute chains
+_Content = types.Content
+_Part = types.Part
 
-    Your capabilities include:
-    - Analyzing what the user is looking at in the viewport using raycast
-    - Getting information about selected prims (3D objects)
-    - Retrieving detailed properties of specific prims
-    - Creating new 3D primitives (cubes, spheres, cylinders, cones)
-    - Listing all prims in the scene hierarchy
-    - Understanding camera position and orientation
+# Sentinel marking the end of a pumped event stream
+_STREAM_END = object()
 
-    Guidelines:
-    1. When the user asks "what am I looking at" or similar, use the raycast_from_camera tool
-    2. When the user asks about their selection, use the get_selection tool
-    3. When the user wants to create objects, use the create_prim tool with appropriate parameters
-    4. When exploring the scene, use list_all_prims to understand the hierarchy
-    5. Always provide clear, helpful responses about the 3D scene
-    6. If a tool returns an error, explain it clearly to the user
+# Shared empty params mapping; consumers treat tool params as read-only
+_EMPTY_PARAMS: Dict[str, Any] = {}
 
-    Be conversational but concise. Focus on helping users understand and manipulate their 3D scenes effectively.
-""")
+# Shared marker for tool activity suppressed on the text-only path; lets the
+# caller track tool usage without building per-event dicts
+_TOOL_MARKER: Dict[str, Any] = {"type": "tool_marker", "done": False}
+
+# Cap on remembered (user_id, session_id) pairs; oldest entries are evicted
+_SESSION_CACHE_MAX = 1024
+
+# Above this many concurrent turns, skip duplicate-submit detection rather
+# than grow the bookkeeping dict unboundedly
+_INFLIGHT_MAX = 64
+
+
+class _InflightTurn:
+    """Shared state for one in-flight turn being followed by duplicates."""
+
+    __slots__ = ("events", "done", "condition")
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.done = False
+        self.condition = asyncio.Condition()
+
+
+# System instruction for the Omniverse assistant (plain literal; no dedent
+# pass or duplicate string at import)
+SYSTEM_INSTRUCTION = """\
+You are an intelligent assistant for NVIDIA Omniverse, helping users work with 3D scenes and USD (Universal Scene Description) content.
+
+Your capabilities include:
+- Analyzing what the user is looking at in the viewport using raycast
+- Getting information about selected prims (3D objects)
+- Retrieving detailed properties of specific prims
+- Creating new 3D primitives (cubes, spheres, cylinders, cones)
+- Listing all prims in the scene hierarchy
+- Understanding camera position and orientation
+
+Guidelines:
+1. When the user asks "what am I looking at" or similar, use the raycast_from_camera tool
+2. When the user asks about their selection, use the get_selection tool
+3. When the user wants to create objects, use the create_prim tool with appropriate parameters; for several objects at once, use create_prims with a list of specs
+4. When exploring the scene, use list_all_prims to understand the hierarchy
+5. Always provide clear, helpful responses about the 3D scene
+6. If a tool returns an error, explain it clearly to the user
+
+Be conversational but concise. Focus on helping users understand and manipulate their 3D scenes effectively.
+"""
 
 
 class OmniverseAgent:
@@ -63,6 +107,14 @@ class OmniverseAgent:
         self.settings = settings
         self.agent: Optional[Agent] = None
         self.runner: Optional[Runner] = None
+        self._semantic_cache: Optional[SemanticCache] = None
+        self._session_manager: Optional[SessionManager] = None
+        # LRU of known (user_id, session_id) pairs so follow-up turns skip
+        # the await into the session service entirely
+        self._known_sessions: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        # Duplicate concurrent submits of the same turn follow the leader's
+        # event stream instead of running a second generation
+        self._inflight: Dict[Tuple[str, str, str], _InflightTurn] = {}
         self._initialized = False
         self._lock = asyncio.Lock()
 
@@ -73,9 +125,13 @@ class OmniverseAgent:
         Creates the agent with USD tools and sets up the Runner
         with session service for context management.
         """
+        # Double-checked: the already-initialized fast path never awaits
+        if self._initialized:
+            logger.info("OmniverseAgent already initialized")
+            return
+
         async with self._lock:
             if self._initialized:
-                logger.info("OmniverseAgent already initialized")
                 return
 
             try:
@@ -93,14 +149,22 @@ class OmniverseAgent:
                     tools=USD_TOOLS,
                 )
 
-                # Create the runner with session service
-                session_manager = get_session_manager()
+                # Create the runner with session service; keep the manager
+                # reference so per-turn code skips the global lookup
+                self._session_manager = get_session_manager()
                 self.runner = Runner(
                     agent=self.agent,
-                    app_name=session_manager.APP_NAME,
-                    session_service=session_manager.session_service,
+                    app_name=self._session_manager.APP_NAME,
+                    session_service=self._session_manager.session_service,
                 )
 
+                # Optional semantic response cache in front of the LLM
+                if self.settings.enable_semantic_cache:
+                    self._semantic_cache = SemanticCache(
+                        self.settings,
+                        threshold=self.settings.semantic_cache_threshold
+                    )
+
                 self._initialized = True
                 logger.info("OmniverseAgent initialized successfully")
 
@@ -113,6 +177,7 @@ class OmniverseAgent:
         message: str,
         user_id: str,
         session_id: Optional[str] = None,
+        text_only: bool = False,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Run a conversation turn with the agent.
@@ -121,6 +186,7 @@ class OmniverseAgent:
             message: User message
             user_id: User identifier
             session_id: Optional session ID for continuing a conversation
+            text_only: Skip building tool_call/tool_result event dicts
 
         Yields:
             Dict with event type and data
@@ -128,35 +194,164 @@ class OmniverseAgent:
         if not self._initialized or self.runner is None:
             raise RuntimeError("OmniverseAgent not initialized")
 
+        # Duplicate-submit detection only applies to turns addressed at an
+        # existing session; a None session_id legitimately means "new chat"
+        if session_id is None or len(self._inflight) >= _INFLIGHT_MAX:
+            async for event_data in self._run_turn(message, user_id, session_id, text_only):
+                yield event_data
+            return
+
+        # Key on the message itself, not its hash: a hash collision would
+        # silently stream a follower the wrong reply, and the tuple only
+        # lives for the duration of the turn
+        flight_key = (user_id, session_id, message)
+        flight = self._inflight.get(flight_key)
+        if flight is not None:
+            # Follower: replay the leader's events as they arrive
+            idx = 0
+            while True:
+                async with flight.condition:
+                    await flight.condition.wait_for(
+                        lambda: len(flight.events) > idx or flight.done
+                    )
+                    new_events = flight.events[idx:]
+                    idx += len(new_events)
+                    finished = flight.done and idx == len(flight.events)
+                # Yield outside the lock so a slow consumer can't stall
+                # the leader's publishes
+                for event_data in new_events:
+                    yield event_data
+                if finished:
+                    return
+
+        flight = _InflightTurn()
+        self._inflight[flight_key] = flight
         try:
-            # Get or create session
-            session_manager = get_session_manager()
-            session = await session_manager.get_or_create_session(user_id, session_id)
-            current_session_id = session.id
+            async for event_data in self._run_turn(message, user_id, session_id, text_only):
+                async with flight.condition:
+                    flight.events.append(event_data)
+                    flight.condition.notify_all()
+                yield event_data
+        finally:
+            self._inflight.pop(flight_key, None)
+            async with flight.condition:
+                flight.done = True
+                flight.condition.notify_all()
+
+    async def _run_turn(
+        self,
+        message: str,
+        user_id: str,
+        session_id: Optional[str],
+        text_only: bool,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Run one turn through the Runner; see run_conversation."""
+        # len() once up front; reused by logging below
+        msg_len = len(message)
 
-            logger.info(
-                "Running conversation",
-                user_id=user_id,
-                session_id=current_session_id,
-                message_length=len(message)
-            )
+        try:
+            # Resolve the session; pairs seen before skip the session
+            # service round trip (in-memory sessions never expire)
+            cache_key = (user_id, session_id)
+            if session_id is not None and cache_key in self._known_sessions:
+                self._known_sessions.move_to_end(cache_key)
+                current_session_id = session_id
+            else:
+                session = await self._session_manager.get_or_create_session(user_id, session_id)
+                current_session_id = session.id
+                self._known_sessions[(user_id, current_session_id)] = None
+                if len(self._known_sessions) > _SESSION_CACHE_MAX:
+                    self._known_sessions.popitem(last=False)
+
+            if _is_enabled(_INFO):
+                logger.info(
+                    "Running conversation",
+                    user_id=user_id,
+                    session_id=current_session_id,
+                    message_length=msg_len
+                )
+
+            # Semantic cache: replay a previous reply for an equivalent
+            # message instead of paying for a fresh LLM generation
+            embedding = None
+            if self._semantic_cache is not None:
+                embedding = await self._semantic_cache.embed(message)
+                if embedding is not None:
+                    cached_events = self._semantic_cache.find(
+                        user_id, current_session_id, embedding
+                    )
+                    if cached_events is not None:
+                        if _is_enabled(_INFO):
+                            logger.info(
+                                "Semantic cache hit",
+                                user_id=user_id,
+                                session_id=current_session_id
+                            )
+                        # Replay bypasses the Runner, which normally appends
+                        # both turns to the session; record them here so the
+                        # next turn's LLM context includes this exchange
+                        await self._record_replay(
+                            user_id, current_session_id, message, cached_events
+                        )
+                        for event_data in cached_events:
+                            yield event_data
+                        yield {
+                            "type": "end",
+                            "session_id": current_session_id,
+                            "done": True
+                        }
+                        return
+
+            # Create content for the message (tuple avoids list resizing)
+            content = _Content(role="user", parts=(_Part(text=message),))
 
-            # Create content for the message
-            content = types.Content(
-                role="user",
-                parts=[types.Part(text=message)]
+            # Pump runner events through a bounded queue so slow downstream
+            # consumers don't backpressure the LLM socket reads
+            queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+            producer = asyncio.create_task(
+                self._pump_events(content, user_id, current_session_id, queue)
             )
 
-            # Run the agent and stream events
-            async for event in self.runner.run_async(
-                user_id=user_id,
-                session_id=current_session_id,
-                new_message=content
-            ):
-                # Convert ADK events to our format
-                event_data = self._convert_event(event)
-                if event_data:
-                    yield event_data
+            replay_events = []
+            used_tools = False
+            # One-event lookahead so the last payload event can be tagged
+            # "final" before the end frame; transports can flush eagerly on
+            # it instead of waiting out their coalescing window
+            pending = None
+            try:
+                while True:
+                    event = await queue.get()
+                    if event is _STREAM_END:
+                        break
+                    if isinstance(event, BaseException):
+                        raise event
+
+                    # Convert ADK events to our format
+                    for event_data in self._convert_event(event, text_only):
+                        if event_data is _TOOL_MARKER:
+                            used_tools = True
+                            continue
+                        if event_data["type"] != "text_delta":
+                            used_tools = True
+                        if pending is not None:
+                            replay_events.append(pending)
+                            yield pending
+                        pending = event_data
+            finally:
+                if not producer.done():
+                    producer.cancel()
+
+            if pending is not None:
+                pending["final"] = True
+                replay_events.append(pending)
+                yield pending
+
+            # Cache only pure-text turns; tool results reflect live scene
+            # state and must not be replayed
+            if embedding is not None and replay_events and not used_tools:
+                self._semantic_cache.store(
+                    user_id, current_session_id, embedding, replay_events
+                )
 
             # Yield completion event
             yield {
@@ -165,11 +360,12 @@ class OmniverseAgent:
                 "done": True
             }
 
-            logger.info(
-                "Conversation completed",
-                user_id=user_id,
-                session_id=current_session_id
-            )
+            if _is_enabled(_INFO):
+                logger.info(
+                    "Conversation completed",
+                    user_id=user_id,
+                    session_id=current_session_id
+                )
 
         except Exception as e:
             logger.error(
@@ -183,73 +379,207 @@ class OmniverseAgent:
                 "done": True
             }
 
-    def _convert_event(self, event) -> Optional[Dict[str, Any]]:
+    async def _pump_events(
+        self,
+        content,
+        user_id: str,
+        session_id: str,
+        queue: asyncio.Queue,
+    ) -> None:
+        """
+        Drain runner events into a queue, overlapping LLM token arrival
+        with downstream response writes.
+
+        Exceptions are forwarded through the queue; the stream always ends
+        with the sentinel or an exception item.
+        """
+        try:
+            async for event in self.runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=content
+            ):
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    async def _record_replay(
+        self,
+        user_id: str,
+        session_id: str,
+        message: str,
+        cached_events: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Append a replayed exchange to the ADK session.
+
+        Best-effort: a recording failure degrades later context but must
+        not break the reply already being streamed.
+
+        Args:
+            user_id: User the exchange belongs to
+            session_id: Session to append to
+            message: The incoming user message
+            cached_events: Cached events being replayed as the reply
+        """
+        reply_text = "".join(
+            e["content"] for e in cached_events if e.get("type") == "text_delta"
+        )
+        try:
+            session_service = self._session_manager.session_service
+            session = await session_service.get_session(
+                app_name=self._session_manager.APP_NAME,
+                user_id=user_id,
+                session_id=session_id,
+            )
+            if session is None:
+                return
+            await session_service.append_event(
+                session,
+                Event(
+                    author="user",
+                    content=_Content(role="user", parts=(_Part(text=message),)),
+                ),
+            )
+            if reply_text:
+                await session_service.append_event(
+                    session,
+                    Event(
+                        author=self.agent.name,
+                        content=_Content(role="model", parts=(_Part(text=reply_text),)),
+                    ),
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to record replayed exchange",
+                error=str(e),
+                session_id=session_id
+            )
+
+    def _convert_event(self, event, text_only: bool = False) -> List[Dict[str, Any]]:
         """
         Convert ADK event to our response format.
 
+        A single frame can carry several parts (text plus function calls).
+        Adjacent text parts are coalesced into one delta so consumers wake
+        up once per frame instead of once per part.
+
         Args:
             event: ADK event object
+            text_only: Emit the shared ``_TOOL_MARKER`` for tool parts
+                instead of building tool_call/tool_result dicts
 
         Returns:
-            Dict with event data or None if event should be skipped
+            List of event dicts; empty if the frame carries nothing usable
         """
+        # Handle different event types based on ADK event structure;
+        # the exact structure depends on the ADK version. getattr with a
+        # default is one lookup per attribute vs hasattr's lookup + test.
+        events: List[Dict[str, Any]] = []
         try:
-            # Handle different event types based on ADK event structure
-            # The exact structure depends on the ADK version
-
             # Check for text content
-            if hasattr(event, 'content') and event.content:
-                content = event.content
-                if hasattr(content, 'parts'):
-                    for part in content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            return {
-                                "type": "text_delta",
-                                "content": part.text,
-                                "done": False
-                            }
-                        if hasattr(part, 'function_call') and part.function_call:
-                            fc = part.function_call
-                            return {
+            content = getattr(event, 'content', None)
+            if content is not None:
+                parts = getattr(content, 'parts', None)
+                if parts:
+                    text_parts: List[str] = []
+                    for part in parts:
+                        text = getattr(part, 'text', None)
+                        if text:
+                            text_parts.append(text)
+                            continue
+                        fc = getattr(part, 'function_call', None)
+                        if fc:
+                            if text_parts:
+                                events.append({
+                                    "type": "text_delta",
+                                    "content": "".join(text_parts),
+                                    "done": False
+                                })
+                                text_parts = []
+                            if text_only:
+                                events.append(_TOOL_MARKER)
+                                continue
+                            # Pass plain dicts through untouched; only copy
+                            # proto/MapComposite args that need coercion
+                            args = fc.args
+                            if not args:
+                                params = _EMPTY_PARAMS
+                            elif type(args) is dict:
+                                params = args
+                            else:
+                                params = dict(args)
+                            events.append({
                                 "type": "tool_call",
                                 "tool": fc.name,
-                                "params": dict(fc.args) if fc.args else {},
+                                "params": params,
                                 "done": False
-                            }
-                        if hasattr(part, 'function_response') and part.function_response:
-                            fr = part.function_response
-                            return {
+                            })
+                            continue
+                        fr = getattr(part, 'function_response', None)
+                        if fr:
+                            if text_parts:
+                                events.append({
+                                    "type": "text_delta",
+                                    "content": "".join(text_parts),
+                                    "done": False
+                                })
+                                text_parts = []
+                            if text_only:
+                                events.append(_TOOL_MARKER)
+                                continue
+                            events.append({
                                 "type": "tool_result",
                                 "tool": fr.name,
                                 "result": fr.response,
                                 "done": False
-                            }
+                            })
+                    if text_parts:
+                        events.append({
+                            "type": "text_delta",
+                            "content": "".join(text_parts),
+                            "done": False
+                        })
 
             # Check for actions (tool calls in newer ADK)
-            if hasattr(event, 'actions'):
-                for action in event.actions:
-                    if hasattr(action, 'tool_name'):
-                        return {
-                            "type": "tool_call",
-                            "tool": action.tool_name,
-                            "params": action.tool_input if hasattr(action, 'tool_input') else {},
-                            "done": False
-                        }
+            if not events:
+                actions = getattr(event, 'actions', None)
+                if actions:
+                    for action in actions:
+                        tool_name = getattr(action, 'tool_name', None)
+                        if tool_name is not None:
+                            if text_only:
+                                events.append(_TOOL_MARKER)
+                                continue
+                            events.append({
+                                "type": "tool_call",
+                                "tool": tool_name,
+                                "params": getattr(action, 'tool_input', None) or {},
+                                "done": False
+                            })
 
-            return None
+            return events
 
-        except Exception as e:
-            logger.warning(f"Error converting event: {e}")
-            return None
+        except (AttributeError, TypeError) as e:
+            # Only shape mismatches land here; anything else should surface
+            logger.warning(f"Unexpected ADK event shape: {e}")
+            return events
 
     async def shutdown(self) -> None:
         """Clean up agent resources."""
+        if not self._initialized:
+            return
+
         async with self._lock:
             if self._initialized:
                 logger.info("Shutting down OmniverseAgent")
+                # Clear the flag first so concurrent shutdown callers hit
+                # the lock-free fast path immediately
+                self._initialized = False
                 self.agent = None
                 self.runner = None
-                self._initialized = False
                 logger.info("OmniverseAgent shut down")
 
     @property
@@ -32,6 +32,7 @@ class ADKChatClient:
         """
         self.settings = settings
         self._agent: Optional[OmniverseAgent] = None
+        self._session_manager = None
         self._initialized = False
         self._lock = asyncio.Lock()
 
@@ -42,9 +43,13 @@ class ADKChatClient:
         Raises:
             ADKClientError: If initialization fails
         """
+        # Double-checked: the already-initialized fast path never awaits
+        if self._initialized:
+            logger.info("ADK client already initialized")
+            return
+
         async with self._lock:
             if self._initialized:
-                logger.info("ADK client already initialized")
                 return
 
             try:
@@ -53,8 +58,9 @@ class ADKChatClient:
                     model=self.settings.model_name
                 )
 
-                # Ensure session manager is initialized
-                get_session_manager()
+                # Ensure session manager is initialized and keep the
+                # reference so later calls skip the global lookup
+                self._session_manager = get_session_manager()
 
                 # Create and initialize the OmniverseAgent with Runner
                 self._agent = await create_omniverse_agent(self.settings)
@@ -77,6 +83,7 @@ class ADKChatClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         status_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        text_only: bool = False,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Stream chat responses with tool calling support using Runner.
@@ -88,6 +95,8 @@ class ADKChatClient:
             temperature: Optional temperature override (not used in Runner mode)
             max_tokens: Optional max tokens override (not used in Runner mode)
             status_callback: Optional callback for status updates
+            text_only: Skip building tool event dicts; only text_delta,
+                error and end events are yielded
 
         Yields:
             Dict with event type and data:
@@ -106,10 +115,12 @@ class ADKChatClient:
                 detail="Call initialize() before streaming"
             )
 
+        msg_len = len(message)
+
         try:
             logger.info(
                 "Starting chat with Runner",
-                message_length=len(message),
+                message_length=msg_len,
                 user_id=user_id,
                 session_id=conversation_id
             )
@@ -119,6 +130,7 @@ class ADKChatClient:
                 message=message,
                 user_id=user_id,
                 session_id=conversation_id,
+                text_only=text_only,
             ):
                 yield event
 
@@ -160,20 +172,28 @@ class ADKChatClient:
             message=message,
             temperature=temperature,
             max_tokens=max_tokens,
-            conversation_id=conversation_id
+            conversation_id=conversation_id,
+            text_only=True
         ):
-            if event.get("type") == "text_delta":
-                yield event.get("content", "")
+            # text_only guarantees only text_delta/error/end events, so
+            # direct indexing is safe for the text case
+            if event["type"] == "text_delta":
+                yield event["content"]
 
     async def shutdown(self) -> None:
         """Cleanup ADK client resources."""
+        if not self._initialized:
+            return
+
         async with self._lock:
             if self._initialized:
                 logger.info("Shutting down ADK client")
+                # Clear the flag first so concurrent shutdown callers hit
+                # the lock-free fast path immediately
+                self._initialized = False
                 if self._agent:
                     await self._agent.shutdown()
                     self._agent = None
-                self._initialized = False
                 logger.info("ADK client shut down successfully")
 
     @property
@@ -1,20 +1,30 @@
 """Kit WebSocket connection manager for tool execution."""
 
 import asyncio
-import json
-import uuid
-from typing import Dict, Any, Optional, List, Callable
+import logging
+from typing import Dict, Any, Optional, List, Callable, Tuple, Union
+
+import orjson
 from dataclasses import dataclass, field
 
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Checked at call time: this module is imported (via the route imports in
+# main) before setup_logging runs, so a value captured here would freeze
+# the pre-configuration level. isEnabledFor caches per level internally,
+# so the per-call check stays cheap while still skipping f-string and
+# kwarg materialization for suppressed levels.
+_is_enabled = logging.getLogger().isEnabledFor
+_INFO = logging.INFO
+_DEBUG = logging.DEBUG
+
 
-@dataclass
+@dataclass(slots=True)
 class PendingCall:
     """Represents a pending tool call waiting for result."""
-    call_id: str
+    call_id: int
     tool_name: str
     future: asyncio.Future
     status_callback: Optional[Callable[[str, str, str], None]] = None
@@ -32,7 +42,14 @@ class KitConnectionManager:
         """Initialize the connection manager."""
         self.websocket = None
         self.registered_tools: List[Dict[str, Any]] = []
-        self.pending_calls: Dict[str, PendingCall] = {}
+        # Keyed by monotonically increasing int: small-int keys hash
+        # fastest and can't collide, unlike truncated uuid hex
+        self.pending_calls: Dict[int, PendingCall] = {}
+        self._next_id = 0
+        # Constant JSON-RPC envelope prefix per tool name, built once
+        self._frame_prefix: Dict[str, bytes] = {}
+        # In-progress chunked results (tool.result_begin/.../end)
+        self._partial_results: Dict[int, Dict[str, Any]] = {}
         self._connected = False
         self._lock = asyncio.Lock()
 
@@ -48,10 +65,11 @@ class KitConnectionManager:
         Args:
             websocket: WebSocket connection from Kit
         """
-        async with self._lock:
-            self.websocket = websocket
-            self._connected = True
-            logger.info("Kit connected to backend")
+        # Two attribute stores; the GIL makes each atomic and no awaits
+        # interleave, so no lock is needed here
+        self.websocket = websocket
+        self._connected = True
+        logger.info("Kit connected to backend")
 
     async def unregister_connection(self) -> None:
         """Unregister Kit connection."""
@@ -67,6 +85,8 @@ class KitConnectionManager:
                         ConnectionError("Kit disconnected while waiting for result")
                     )
             self.pending_calls.clear()
+            # Chunked results mid-stream will never see their end frame
+            self._partial_results.clear()
 
             logger.info("Kit disconnected from backend")
 
@@ -113,11 +133,16 @@ class KitConnectionManager:
             TimeoutError: If tool execution times out
             Exception: If tool execution fails
         """
-        if not self.is_connected:
+        # Snapshot the socket so a concurrent disconnect between the check
+        # and the send fails naturally with ConnectionError from the send
+        websocket = self.websocket
+        if not self._connected or websocket is None:
             raise ConnectionError("Kit is not connected")
 
-        call_id = f"call-{uuid.uuid4().hex[:8]}"
-        future = asyncio.get_event_loop().create_future()
+        self._next_id += 1
+        call_id = self._next_id
+        # get_running_loop is the C fast path and never creates a loop
+        future = asyncio.get_running_loop().create_future()
 
         # Register pending call
         self.pending_calls[call_id] = PendingCall(
@@ -127,43 +152,104 @@ class KitConnectionManager:
             status_callback=status_callback
         )
 
-        logger.info(f"Calling tool: {tool_name}", call_id=call_id, params=parameters)
+        if _is_enabled(_INFO):
+            logger.info(f"Calling tool: {tool_name}", call_id=call_id, params=parameters)
 
         try:
-            # Send JSON-RPC 2.0 request
-            request = {
-                "jsonrpc": "2.0",
-                "method": tool_name,
-                "params": parameters,
-                "id": call_id
-            }
-
-            await self.websocket.send_text(json.dumps(request))
+            # Splice the JSON-RPC 2.0 frame from byte constants; only the
+            # params payload needs a real serializer pass. The envelope
+            # prefix is memoized per tool name, and the id travels as a
+            # string for wire compatibility (Kit echoes it back).
+            prefix = self._frame_prefix.get(tool_name)
+            if prefix is None:
+                prefix = self._frame_prefix.setdefault(
+                    tool_name,
+                    b'{"jsonrpc":"2.0","method":"' + tool_name.encode() + b'","params":'
+                )
+            frame = (
+                prefix + orjson.dumps(parameters)
+                + b',"id":"' + str(call_id).encode() + b'"}'
+            )
+
+            await websocket.send_bytes(frame)
 
             # Wait for result with timeout
             result = await asyncio.wait_for(future, timeout=timeout)
 
-            logger.info(f"Tool completed: {tool_name}", call_id=call_id, success=result.get("success"))
+            if _is_enabled(_INFO):
+                logger.info(f"Tool completed: {tool_name}", call_id=call_id, success=result.get("success"))
             return result
 
         except asyncio.TimeoutError:
+            # The response never came, so the entry is still ours to drop;
+            # a chunked result may have started streaming, so drop any
+            # partial accumulation too
+            self.pending_calls.pop(call_id, None)
+            self._partial_results.pop(call_id, None)
             logger.error(f"Tool timeout: {tool_name}", call_id=call_id)
             raise TimeoutError(f"Tool {tool_name} timed out after {timeout}s")
 
-        finally:
-            # Clean up pending call
+        except BaseException:
+            # Send failure or cancellation mid-wait: remove our entries (a
+            # no-op if the response already resolved and popped them) so
+            # cancelled calls can't accumulate in pending_calls or leave
+            # half-assembled chunked results behind
             self.pending_calls.pop(call_id, None)
+            self._partial_results.pop(call_id, None)
+            raise
+
+    async def call_tools_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        timeout: float = 30.0
+    ) -> List[Any]:
+        """
+        Call several Kit tools with overlapped round-trips.
+
+        Each call still travels as its own JSON-RPC frame — the deployed
+        Kit client routes frames individually and doesn't speak JSON-RPC
+        batch arrays — but all requests are dispatched before any
+        response is awaited, so N calls cost roughly one round-trip
+        instead of N.
+
+        Args:
+            calls: List of (tool_name, parameters) pairs
+            timeout: Per-call timeout in seconds
 
-    async def handle_message(self, message: str) -> None:
+        Returns:
+            Results in call order; a failed call yields
+            {"success": False, "error": str} instead of raising
+        """
+        results = await asyncio.gather(
+            *(self.call_tool(name, params, timeout=timeout)
+              for name, params in calls),
+            return_exceptions=True
+        )
+        return [
+            {"success": False, "error": str(result)}
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
+    async def handle_message(self, message: Union[str, bytes]) -> None:
         """
         Handle incoming message from Kit.
 
         Args:
-            message: Raw JSON message string
+            message: Raw JSON message (str or utf-8 bytes); the Kit
+                client may coalesce several messages into one frame,
+                newline-separated
         """
+        separator = b"\n" if isinstance(message, bytes) else "\n"
+        if separator in message:
+            for part in message.split(separator):
+                if part:
+                    await self.handle_message(part)
+            return
+
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON from Kit: {e}")
             return
 
@@ -175,6 +261,19 @@ class KitConnectionManager:
         else:
             logger.warn(f"Unknown message format from Kit: {data}")
 
+    async def handle_messages(self, messages: List[Union[str, bytes]]) -> None:
+        """
+        Handle a batch of incoming messages from Kit.
+
+        Dispatching several queued frames in one pass amortizes the
+        JSON-RPC routing overhead under bursty tool traffic.
+
+        Args:
+            messages: Raw JSON message strings
+        """
+        for message in messages:
+            await self.handle_message(message)
+
     async def _handle_notification(self, data: Dict[str, Any]) -> None:
         """Handle JSON-RPC notification (no id)."""
         method = data.get("method")
@@ -185,17 +284,58 @@ class KitConnectionManager:
             tools = params.get("tools", [])
             self.register_tools(tools)
 
+        elif method == "tool.result_begin":
+            # Kit streams oversized results (large prim listings) as a
+            # begin/chunk/end sequence; accumulate until the end marker
+            try:
+                cid = int(params.get("call_id"))
+            except (TypeError, ValueError):
+                logger.warn(f"Bad chunked-result id: {params.get('call_id')}")
+                return
+            self._partial_results[cid] = {
+                "meta": params.get("meta", {}),
+                "prims": []
+            }
+
+        elif method == "tool.result_chunk":
+            try:
+                cid = int(params.get("call_id"))
+            except (TypeError, ValueError):
+                return
+            partial = self._partial_results.get(cid)
+            if partial is not None:
+                partial["prims"].extend(params.get("prims", []))
+
+        elif method == "tool.result_end":
+            try:
+                cid = int(params.get("call_id"))
+            except (TypeError, ValueError):
+                return
+            partial = self._partial_results.pop(cid, None)
+            if partial is None:
+                logger.warn(f"Chunked result end without begin: {cid}")
+                return
+            result = dict(partial["meta"])
+            result["prims"] = partial["prims"]
+            pending = self.pending_calls.pop(cid, None)
+            if pending and not pending.future.done():
+                pending.future.set_result(result)
+
         elif method == "tool.status":
             # Status update
             call_id = params.get("call_id")
             status = params.get("status")
             message = params.get("message", "")
 
-            pending = self.pending_calls.get(call_id)
+            try:
+                pending = self.pending_calls.get(int(call_id))
+            except (TypeError, ValueError):
+                pending = None
             if pending and pending.status_callback:
                 pending.status_callback(call_id, status, message)
 
-            logger.debug(f"Tool status: {status}", call_id=call_id, message=message)
+            if _is_enabled(_DEBUG):
+                logger.debug(f"Tool status: {status}", call_id=call_id, message=message)
 
         else:
             logger.warn(f"Unknown notification method: {method}")
@@ -208,7 +348,15 @@ class KitConnectionManager:
             logger.warn("Response missing id field")
             return
 
-        pending = self.pending_calls.get(call_id)
+        try:
+            call_id = int(call_id)
+        except (TypeError, ValueError):
+            logger.warn(f"Non-numeric response id: {call_id}")
+            return
+
+        # Pop while resolving: one dict op per RPC instead of a get here
+        # plus a cleanup pop in call_tool
+        pending = self.pending_calls.pop(call_id, None)
         if not pending:
             logger.warn(f"No pending call for id: {call_id}")
             return
@@ -229,8 +377,9 @@ class KitConnectionManager:
             pending.future.set_result(result)
 
 
-# Global connection manager instance
-_kit_manager: Optional[KitConnectionManager] = None
+# Global connection manager instance, created at import so the getter is
+# a branch-free return on hot tool-call paths
+_kit_manager = KitConnectionManager()
 
 
 def get_kit_manager() -> KitConnectionManager:
@@ -240,7 +389,4 @@ def get_kit_manager() -> KitConnectionManager:
     Returns:
         KitConnectionManager instance
     """
-    global _kit_manager
-    if _kit_manager is None:
-        _kit_manager = KitConnectionManager()
     return _kit_manager
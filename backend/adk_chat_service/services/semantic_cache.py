@@ -0,0 +1,145 @@
+"""Semantic response cache for agent conversation turns.
+
+Caches completed replies keyed by an embedding of the user message and
+replays them for semantically equivalent follow-up questions, skipping the
+LLM round-trip entirely. Entries are scoped to one (user, session) pair —
+a message like "yes" or "do that again" means something different in every
+conversation, so replies never leak across sessions — and evicted FIFO to
+bound memory.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import Settings
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# Embedding model used for cache keys; small and cheap relative to a chat turn
+EMBEDDING_MODEL = "text-embedding-004"
+
+
+class SemanticCache:
+    """
+    In-memory semantic-similarity cache of conversation replies.
+
+    Stores (unit embedding, event list) tuples per (user, session) pair.
+    Lookups compute a normalized dot product against the stored vectors and
+    accept the best match when it clears the similarity threshold.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        threshold: float = 0.87,
+        max_entries_per_session: int = 32
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            settings: Application settings (provides the API key)
+            threshold: Cosine-similarity acceptance threshold
+            max_entries_per_session: FIFO eviction bound per session
+        """
+        self.settings = settings
+        self.threshold = threshold
+        self.max_entries_per_session = max_entries_per_session
+        self._entries: Dict[
+            Tuple[str, str], Deque[Tuple[np.ndarray, List[Dict[str, Any]]]]
+        ] = {}
+        self._client = None
+
+    def _get_client(self):
+        """Lazily create the genai client used for embeddings."""
+        if self._client is None:
+            from google import genai
+            self._client = genai.Client(api_key=self.settings.google_api_key)
+        return self._client
+
+    async def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed text as a unit-normalized vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit float32 vector, or None if embedding failed (cache bypassed)
+        """
+        try:
+            client = self._get_client()
+            result = await client.aio.models.embed_content(
+                model=EMBEDDING_MODEL,
+                contents=text
+            )
+            vec = np.asarray(result.embeddings[0].values, dtype=np.float32)
+            norm = float(np.linalg.norm(vec))
+            if norm == 0.0:
+                return None
+            return vec / norm
+
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed", error=str(e))
+            return None
+
+    def find(
+        self,
+        user_id: str,
+        session_id: str,
+        embedding: np.ndarray
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a cached reply for a semantically similar message.
+
+        Args:
+            user_id: User whose cache to search
+            session_id: Session the message belongs to
+            embedding: Unit embedding of the incoming message
+
+        Returns:
+            Cached event list on a hit, None on a miss
+        """
+        entries = self._entries.get((user_id, session_id))
+        if not entries:
+            return None
+
+        matrix = np.stack([entry[0] for entry in entries])
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+
+        if float(scores[best]) >= self.threshold:
+            return entries[best][1]
+        return None
+
+    def store(
+        self,
+        user_id: str,
+        session_id: str,
+        embedding: np.ndarray,
+        events: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Store a completed reply; evicts the oldest entry when full.
+
+        Args:
+            user_id: User the reply belongs to
+            session_id: Session the reply belongs to
+            embedding: Unit embedding of the user message
+            events: Events to replay on a future hit
+        """
+        entries = self._entries.setdefault(
+            (user_id, session_id), deque(maxlen=self.max_entries_per_session)
+        )
+        entries.append((embedding, list(events)))
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        """Drop cached entries for one user's sessions, or everything when None."""
+        if user_id is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
@@ -1,8 +1,9 @@
 """Session management using Google ADK InMemorySessionService."""
 
 import asyncio
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import heapq
+import time
+from typing import List, Optional, Dict, Any, Tuple
 
 from google.adk.sessions import InMemorySessionService, Session
 from google.adk.runners import Runner
@@ -30,8 +31,15 @@ class SessionManager:
             session_timeout_hours: Session timeout in hours (default: 3 hours)
         """
         self.session_service = InMemorySessionService()
-        self.session_timeout = timedelta(hours=session_timeout_hours)
-        self._session_timestamps: Dict[str, datetime] = {}
+        # Monotonic float seconds: 8-byte values, immune to wall-clock
+        # jumps, and expiry checks are plain float compares with no
+        # timedelta allocation
+        self._timeout_seconds = session_timeout_hours * 3600.0
+        self._session_timestamps: Dict[str, float] = {}
+        # Min-heap of (expiry, session_id) so cleanup touches only entries
+        # actually due instead of scanning every live session; stale
+        # entries (session touched again later) are skipped on pop
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._lock = asyncio.Lock()
 
         logger.info(
@@ -58,8 +66,9 @@ class SessionManager:
             # Try to get existing session
             if session_id:
                 try:
-                    session = await asyncio.to_thread(
-                        self.session_service.get_session,
+                    # InMemorySessionService is a pure dict store; await it
+                    # inline rather than hopping through the thread pool
+                    session = await self.session_service.get_session(
                         app_name=self.APP_NAME,
                         user_id=user_id,
                         session_id=session_id
@@ -67,7 +76,12 @@ class SessionManager:
 
                     if session:
                         # Update timestamp
-                        self._session_timestamps[session_id] = datetime.utcnow()
+                        now = time.monotonic()
+                        self._session_timestamps[session_id] = now
+                        heapq.heappush(
+                            self._expiry_heap,
+                            (now + self._timeout_seconds, session_id)
+                        )
                         logger.debug(
                             "Retrieved existing session",
                             session_id=session_id,
@@ -83,13 +97,17 @@ class SessionManager:
                     )
 
             # Create new session
-            session = await asyncio.to_thread(
-                self.session_service.create_session,
+            session = await self.session_service.create_session(
                 app_name=self.APP_NAME,
                 user_id=user_id
             )
 
-            self._session_timestamps[session.id] = datetime.utcnow()
+            now = time.monotonic()
+            self._session_timestamps[session.id] = now
+            heapq.heappush(
+                self._expiry_heap,
+                (now + self._timeout_seconds, session.id)
+            )
 
             logger.info(
                 "Created new session",
@@ -112,8 +130,7 @@ class SessionManager:
         """
         async with self._lock:
             try:
-                await asyncio.to_thread(
-                    self.session_service.delete_session,
+                await self.session_service.delete_session(
                     app_name=self.APP_NAME,
                     user_id=user_id,
                     session_id=session_id
@@ -145,26 +162,26 @@ class SessionManager:
             int: Number of sessions cleaned up
         """
         async with self._lock:
-            now = datetime.utcnow()
-            expired_sessions = []
-
-            for session_id, timestamp in self._session_timestamps.items():
-                if now - timestamp > self.session_timeout:
-                    expired_sessions.append(session_id)
+            now = time.monotonic()
+            heap = self._expiry_heap
 
             cleaned = 0
-            for session_id in expired_sessions:
-                try:
-                    # Note: We don't have user_id stored, so we can't delete via service
-                    # Just remove from our tracking
-                    self._session_timestamps.pop(session_id, None)
-                    cleaned += 1
-                except Exception as e:
-                    logger.warning(
-                        "Failed to cleanup session",
-                        session_id=session_id,
-                        error=str(e)
-                    )
+            while heap and heap[0][0] <= now:
+                _, session_id = heapq.heappop(heap)
+
+                timestamp = self._session_timestamps.get(session_id)
+                if timestamp is None:
+                    # Already deleted; this heap entry is stale
+                    continue
+                if now - timestamp <= self._timeout_seconds:
+                    # Touched since this entry was pushed; a fresher
+                    # heap entry covers it
+                    continue
+
+                # Note: We don't have user_id stored, so we can't delete via service
+                # Just remove from our tracking
+                del self._session_timestamps[session_id]
+                cleaned += 1
 
             if cleaned > 0:
                 logger.info(
@@ -180,8 +197,9 @@ class SessionManager:
         return len(self._session_timestamps)
 
 
-# Global session manager instance
-_session_manager: Optional[SessionManager] = None
+# Global session manager instance, created at import so the getter is a
+# branch-free return; tests can still swap it via set_session_manager
+_session_manager: SessionManager = SessionManager()
 
 
 def get_session_manager() -> SessionManager:
@@ -190,13 +208,7 @@ def get_session_manager() -> SessionManager:
 
     Returns:
         SessionManager: Global session manager
-
-    Raises:
-        RuntimeError: If session manager not initialized
     """
-    global _session_manager
-    if _session_manager is None:
-        _session_manager = SessionManager()
     return _session_manager
 
 
@@ -1,20 +1,27 @@
 """Stream processing utilities for handling ADK responses."""
 
-import json
+import asyncio
+import time
 import uuid
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Union
+
+import orjson
 
-from ..models import ChatChunk
 from ..utils.exceptions import StreamingError
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Pool of coalescing buffers reused across streams on this event loop;
+# capped so a burst of concurrent streams can't pin memory forever
+_BUF_POOL: list = []
+_BUF_POOL_MAX = 8
+
 
 async def format_stream_as_ndjson(
     stream: AsyncGenerator[str, None],
     conversation_id: Optional[str] = None
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Transform ADK text stream into NDJSON format.
 
@@ -26,41 +33,41 @@ async def format_stream_as_ndjson(
         conversation_id: Optional conversation ID for tracking
 
     Yields:
-        str: NDJSON formatted chat chunks (JSON + newline)
+        bytes: NDJSON formatted chat chunks (JSON + newline)
 
     Raises:
         StreamingError: If stream processing fails
     """
+    # Chunk ids only correlate frames within one stream on the client, so
+    # a per-stream prefix plus counter replaces a uuid4 per token
+    id_prefix = conversation_id or uuid.uuid4().hex[:12]
+
     try:
         chunk_count = 0
 
-        # Stream text chunks
+        # Stream text chunks; chunks are internally constructed and
+        # trusted, so the wire dict is built directly (ChatChunk-shaped)
+        # rather than paying Pydantic validation per token
         async for text_chunk in stream:
             chunk_count += 1
-
-            # Create ChatChunk model
-            chat_chunk = ChatChunk(
-                chunk_id=str(uuid.uuid4()),
-                content=text_chunk,
-                done=False,
-                metadata={"chunk_number": chunk_count}
-            )
-
-            # Serialize to NDJSON (JSON + newline)
-            yield chat_chunk.model_dump_json() + "\n"
+            yield orjson.dumps({
+                "chunk_id": f"{id_prefix}-{chunk_count}",
+                "content": text_chunk,
+                "done": False,
+                "metadata": {"chunk_number": chunk_count}
+            }) + b"\n"
 
         # Send completion chunk
-        final_chunk = ChatChunk(
-            chunk_id=str(uuid.uuid4()),
-            content="",
-            done=True,
-            metadata={
+        yield orjson.dumps({
+            "chunk_id": f"{id_prefix}-{chunk_count + 1}",
+            "content": "",
+            "done": True,
+            "metadata": {
                 "chunk_number": chunk_count + 1,
                 "total_chunks": chunk_count,
                 "conversation_id": conversation_id
             }
-        )
-        yield final_chunk.model_dump_json() + "\n"
+        }) + b"\n"
 
         logger.info(
             "Stream formatting completed",
@@ -76,12 +83,12 @@ async def format_stream_as_ndjson(
         )
         # Send error chunk to client
         error_chunk = {
-            "chunk_id": str(uuid.uuid4()),
+            "chunk_id": f"{id_prefix}-error",
             "content": "",
             "done": True,
             "error": str(e)
         }
-        yield json.dumps(error_chunk) + "\n"
+        yield orjson.dumps(error_chunk) + b"\n"
 
         raise StreamingError(
             message="Failed to format stream as NDJSON",
@@ -89,10 +96,79 @@ async def format_stream_as_ndjson(
         )
 
 
+def _build_text_delta(event: Dict[str, Any], state: Dict[str, Any]) -> bytes:
+    state["chunk_count"] += 1
+    return orjson.dumps({
+        "type": "text_delta",
+        "chunk_id": f"{state['id_prefix']}-{state['seq']}",
+        "content": event.get("content", ""),
+        "done": False,
+        "metadata": {"chunk_number": state["chunk_count"]}
+    }) + b"\n"
+
+
+def _build_tool_call(event: Dict[str, Any], state: Dict[str, Any]) -> bytes:
+    state["tool_call_count"] += 1
+    return orjson.dumps({
+        "type": "tool_call",
+        "chunk_id": f"{state['id_prefix']}-{state['seq']}",
+        "tool": event.get("tool"),
+        "call_id": event.get("call_id"),
+        "params": event.get("params", {}),
+        "done": False,
+        "metadata": {"tool_call_number": state["tool_call_count"]}
+    }) + b"\n"
+
+
+def _build_tool_result(event: Dict[str, Any], state: Dict[str, Any]) -> bytes:
+    return orjson.dumps({
+        "type": "tool_result",
+        "chunk_id": f"{state['id_prefix']}-{state['seq']}",
+        "call_id": event.get("call_id"),
+        "tool": event.get("tool"),
+        "result": event.get("result", {}),
+        "done": False
+    }) + b"\n"
+
+
+def _build_error(event: Dict[str, Any], state: Dict[str, Any]) -> bytes:
+    return orjson.dumps({
+        "type": "error",
+        "chunk_id": f"{state['id_prefix']}-{state['seq']}",
+        "error": event.get("error", "Unknown error"),
+        "done": True
+    }) + b"\n"
+
+
+def _build_end(event: Dict[str, Any], state: Dict[str, Any]) -> bytes:
+    return orjson.dumps({
+        "type": "end",
+        "chunk_id": f"{state['id_prefix']}-{state['seq']}",
+        "content": "",
+        "done": True,
+        "metadata": {
+            "total_chunks": state["chunk_count"],
+            "total_tool_calls": state["tool_call_count"],
+            "conversation_id": state["conversation_id"]
+        }
+    }) + b"\n"
+
+
+# O(1) event-type dispatch for the tool stream formatter; each builder
+# returns a pre-serialized NDJSON line
+_EVENT_BUILDERS = {
+    "text_delta": _build_text_delta,
+    "tool_call": _build_tool_call,
+    "tool_result": _build_tool_result,
+    "error": _build_error,
+    "end": _build_end,
+}
+
+
 async def format_tool_stream_as_ndjson(
     stream: AsyncGenerator[Dict[str, Any], None],
     conversation_id: Optional[str] = None
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Transform ADK tool-enabled stream into NDJSON format.
 
@@ -108,80 +184,35 @@ async def format_tool_stream_as_ndjson(
         conversation_id: Optional conversation ID for tracking
 
     Yields:
-        str: NDJSON formatted events (JSON + newline)
+        bytes: NDJSON formatted events (JSON + newline)
     """
-    try:
-        chunk_count = 0
-        tool_call_count = 0
+    id_prefix = conversation_id or uuid.uuid4().hex[:12]
+
+    # Shared mutable state for the builders (counters and id parts)
+    state: Dict[str, Any] = {
+        "chunk_count": 0,
+        "tool_call_count": 0,
+        "seq": 0,
+        "id_prefix": id_prefix,
+        "conversation_id": conversation_id,
+    }
+    builders = _EVENT_BUILDERS
 
+    try:
         async for event in stream:
+            state["seq"] += 1
             event_type = event.get("type", "unknown")
 
-            if event_type == "text_delta":
-                chunk_count += 1
-                output = {
-                    "type": "text_delta",
-                    "chunk_id": str(uuid.uuid4()),
-                    "content": event.get("content", ""),
-                    "done": False,
-                    "metadata": {"chunk_number": chunk_count}
-                }
-                yield json.dumps(output) + "\n"
-
-            elif event_type == "tool_call":
-                tool_call_count += 1
-                output = {
-                    "type": "tool_call",
-                    "chunk_id": str(uuid.uuid4()),
-                    "tool": event.get("tool"),
-                    "call_id": event.get("call_id"),
-                    "params": event.get("params", {}),
-                    "done": False,
-                    "metadata": {"tool_call_number": tool_call_count}
-                }
-                yield json.dumps(output) + "\n"
-
-            elif event_type == "tool_result":
-                output = {
-                    "type": "tool_result",
-                    "chunk_id": str(uuid.uuid4()),
-                    "call_id": event.get("call_id"),
-                    "tool": event.get("tool"),
-                    "result": event.get("result", {}),
-                    "done": False
-                }
-                yield json.dumps(output) + "\n"
-
-            elif event_type == "error":
-                output = {
-                    "type": "error",
-                    "chunk_id": str(uuid.uuid4()),
-                    "error": event.get("error", "Unknown error"),
-                    "done": True
-                }
-                yield json.dumps(output) + "\n"
-
-            elif event_type == "end":
-                output = {
-                    "type": "end",
-                    "chunk_id": str(uuid.uuid4()),
-                    "content": "",
-                    "done": True,
-                    "metadata": {
-                        "total_chunks": chunk_count,
-                        "total_tool_calls": tool_call_count,
-                        "conversation_id": conversation_id
-                    }
-                }
-                yield json.dumps(output) + "\n"
-
+            builder = builders.get(event_type)
+            if builder is not None:
+                yield builder(event, state)
             else:
                 logger.warn(f"Unknown event type: {event_type}")
 
         logger.info(
             "Tool stream formatting completed",
-            total_chunks=chunk_count,
-            total_tool_calls=tool_call_count,
+            total_chunks=state["chunk_count"],
+            total_tool_calls=state["tool_call_count"],
             conversation_id=conversation_id
         )
 
@@ -193,11 +224,96 @@ async def format_tool_stream_as_ndjson(
         )
         error_output = {
             "type": "error",
-            "chunk_id": str(uuid.uuid4()),
+            "chunk_id": f"{id_prefix}-error",
             "error": str(e),
             "done": True
         }
-        yield json.dumps(error_output) + "\n"
+        yield orjson.dumps(error_output) + b"\n"
+
+
+async def coalesce_stream(
+    stream: AsyncGenerator[Union[str, bytes], None],
+    max_bytes: int = 8192,
+    max_delay: float = 0.005
+) -> AsyncGenerator[bytes, None]:
+    """
+    Coalesce small stream chunks into larger byte buffers.
+
+    Accumulates pre-encoded NDJSON lines until ``max_bytes`` is buffered or
+    ``max_delay`` seconds have passed since the first buffered byte, reducing
+    the number of ASGI send events (and socket writes) per response. The
+    delay bound holds even while the producer stalls: the pending read is
+    raced against the deadline with ``asyncio.wait`` (not cancelled on a
+    timeout, so the source generator is not torn down mid-read). On exit,
+    any in-flight read is cancelled and the source stream closed so a
+    client disconnect doesn't leave the producer chain running.
+
+    Args:
+        stream: Async generator yielding str or bytes chunks
+        max_bytes: Flush threshold in bytes
+        max_delay: Maximum seconds to hold buffered data
+
+    Yields:
+        bytes: Coalesced chunks
+    """
+    # Reuse grown backing storage across streams (flushes only copy out
+    # via bytes(buffer)), sparing a malloc/grow cycle per response
+    buffer = _BUF_POOL.pop() if _BUF_POOL else bytearray()
+    anext_chunk = stream.__anext__
+    pending = None
+    deadline = 0.0
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext_chunk())
+
+            if buffer:
+                remaining = deadline - time.monotonic()
+                if len(buffer) >= max_bytes or remaining <= 0:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+                done, _ = await asyncio.wait({pending}, timeout=remaining)
+                if not done:
+                    # Deadline hit while the producer is idle: flush and keep
+                    # waiting on the same in-flight read
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            else:
+                await asyncio.wait({pending})
+
+            task, pending = pending, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+
+            if not buffer:
+                deadline = time.monotonic() + max_delay
+            buffer += chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+
+        if buffer:
+            yield bytes(buffer)
+
+    finally:
+        # On early exit (client disconnect cancels this generator) an
+        # in-flight read would otherwise keep the whole upstream chain
+        # alive, pulling LLM tokens until its queue fills; cancel it and
+        # close the source so producers unwind promptly
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass
+        await stream.aclose()
+        buffer.clear()
+        if len(_BUF_POOL) < _BUF_POOL_MAX:
+            _BUF_POOL.append(buffer)
 
 
 def add_stream_metadata(
@@ -222,40 +338,48 @@ def add_stream_metadata(
 
 
 async def handle_stream_backpressure(
-    stream: AsyncGenerator[str, None],
-    max_buffer_size: int = 100
-) -> AsyncGenerator[str, None]:
+    stream: AsyncGenerator[Union[str, bytes], None],
+    high_water_bytes: int = 16384,
+    low_water_bytes: int = 4096
+) -> AsyncGenerator[bytes, None]:
     """
     Handle backpressure in streaming responses.
 
-    Implements basic buffering to handle slow consumers.
+    Buffers chunks into a single bytearray; when the buffer reaches the
+    high-water mark it drains down to the low-water mark in one yield,
+    keeping a tail buffered. Compared to flushing everything at the
+    threshold, this smooths the burst-idle pattern: the consumer gets a
+    steady feed while the retained tail absorbs the producer's next
+    burst. Thresholds are byte-based since byte volume, not chunk count,
+    drives the syscall cost.
 
     Args:
-        stream: Async generator yielding text chunks
-        max_buffer_size: Maximum number of chunks to buffer
+        stream: Async generator yielding str or bytes chunks
+        high_water_bytes: Buffer level that triggers draining
+        low_water_bytes: Buffer level drained down to per flush
 
     Yields:
-        str: Text chunks with backpressure handling
+        bytes: Concatenated chunks with backpressure handling
 
     Note:
         This is a basic implementation. For production, consider
         using more sophisticated flow control.
     """
-    buffer = []
+    buffer = bytearray()
 
     try:
         async for chunk in stream:
-            buffer.append(chunk)
+            buffer += chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
 
-            # Yield buffered chunks when buffer is full
-            if len(buffer) >= max_buffer_size:
-                for buffered_chunk in buffer:
-                    yield buffered_chunk
-                buffer.clear()
+            # Drain down to the low-water mark in one yield
+            if len(buffer) >= high_water_bytes:
+                cut = len(buffer) - low_water_bytes
+                yield bytes(memoryview(buffer)[:cut])
+                del buffer[:cut]
 
-        # Yield remaining buffered chunks
-        for buffered_chunk in buffer:
-            yield buffered_chunk
+        # Flush whatever remains
+        if buffer:
+            yield bytes(buffer)
 
     except Exception as e:
         logger.error("Error in backpressure handling", error=str(e))
@@ -12,6 +12,11 @@ class BaseTool(ABC):
     Each tool must implement the execute method and define its schema.
     """
 
+    #: Read-only tools may set this True to let the registry serve repeated
+    #: calls with identical arguments from a short-TTL cache; mutating
+    #: tools must leave it False
+    cacheable: bool = False
+
     def __init__(self, name: str, description: str, parameters: Dict[str, Any]):
         """
         Initialize a tool.
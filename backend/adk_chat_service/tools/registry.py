@@ -1,6 +1,11 @@
 """Tool registry for managing MCP tools (Phase 2)."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .base import BaseTool
 from ..utils.exceptions import ToolRegistrationError
@@ -8,6 +13,17 @@ from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Checked at call time — this module can be imported before setup_logging
+# runs, so a value captured here would freeze the pre-configuration level.
+# isEnabledFor caches per level, so the check is cheap while still keeping
+# per-call logging from walking large parameter dicts at filtered levels.
+_is_enabled = logging.getLogger().isEnabledFor
+_INFO = logging.INFO
+_DEBUG = logging.DEBUG
+
+# Cap on cached tool results; oldest entries evicted first
+_CACHE_MAX = 128
+
 
 class ToolRegistry:
     """
@@ -18,9 +34,25 @@ class ToolRegistry:
     with the ADK client for function calling.
     """
 
-    def __init__(self):
-        """Initialize the tool registry."""
+    def __init__(self, cache_ttl: float = 2.0):
+        """
+        Initialize the tool registry.
+
+        Args:
+            cache_ttl: Seconds a cacheable tool result stays servable
+        """
         self._tools: Dict[str, BaseTool] = {}
+        # Loaders for tools registered lazily; materialized on first use
+        # so rarely-used tools cost neither startup time nor schema bytes
+        self._deferred: Dict[str, Callable[[], BaseTool]] = {}
+        # LRU of (tool_name, sorted kwargs) -> (stored_at, result) for
+        # tools that declare themselves cacheable
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_ttl = cache_ttl
+        # Schema lists are pure functions of the registered tool set;
+        # rebuilt lazily after register/unregister/clear
+        self._mcp_cache: Optional[List[Dict[str, Any]]] = None
+        self._genai_cache: Optional[List[Dict[str, Any]]] = None
         logger.info("Tool registry initialized")
 
     def register(self, tool: BaseTool) -> None:
@@ -39,9 +71,37 @@ class ToolRegistry:
                 detail="Tool names must be unique"
             )
 
-        self._tools[tool.name] = tool
+        # Interned names let dict lookups win on identity before falling
+        # back to character comparison (caller literals are interned too)
+        self._tools[sys.intern(tool.name)] = tool
+        self._mcp_cache = None
+        self._genai_cache = None
         logger.info("Tool registered", tool_name=tool.name)
 
+    def register_deferred(self, name: str, loader: Callable[[], BaseTool]) -> None:
+        """
+        Register a tool loader invoked on first use.
+
+        The tool is constructed (and its schema materialized) only when
+        something asks for it, keeping boot time and the advertised
+        function-declaration payload small for rarely-used tools.
+
+        Args:
+            name: Tool name the loader will provide
+            loader: Zero-argument callable returning the BaseTool
+
+        Raises:
+            ToolRegistrationError: If the name is already taken
+        """
+        if name in self._tools or name in self._deferred:
+            raise ToolRegistrationError(
+                message=f"Tool '{name}' already registered",
+                detail="Tool names must be unique"
+            )
+
+        self._deferred[sys.intern(name)] = loader
+        logger.info("Tool registered (deferred)", tool_name=name)
+
     def unregister(self, tool_name: str) -> None:
         """
         Unregister a tool.
@@ -52,6 +112,11 @@ class ToolRegistry:
         Raises:
             ToolRegistrationError: If tool not found
         """
+        if tool_name in self._deferred:
+            del self._deferred[tool_name]
+            logger.info("Tool unregistered", tool_name=tool_name)
+            return
+
         if tool_name not in self._tools:
             raise ToolRegistrationError(
                 message=f"Tool '{tool_name}' not found",
@@ -59,6 +124,8 @@ class ToolRegistry:
             )
 
         del self._tools[tool_name]
+        self._mcp_cache = None
+        self._genai_cache = None
         logger.info("Tool unregistered", tool_name=tool_name)
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
@@ -71,16 +138,25 @@ class ToolRegistry:
         Returns:
             BaseTool instance or None if not found
         """
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is None:
+            loader = self._deferred.pop(name, None)
+            if loader is not None:
+                tool = loader()
+                self._tools[name] = tool
+                self._mcp_cache = None
+                self._genai_cache = None
+                logger.info("Deferred tool materialized", tool_name=name)
+        return tool
 
     def list_tools(self) -> List[str]:
         """
-        List all registered tool names.
+        List all registered tool names, including deferred ones.
 
         Returns:
             List of tool names
         """
-        return list(self._tools.keys())
+        return list(self._tools.keys()) + list(self._deferred.keys())
 
     def get_mcp_schemas(self) -> List[Dict[str, Any]]:
         """
@@ -89,7 +165,9 @@ class ToolRegistry:
         Returns:
             List of tool schemas in MCP format
         """
-        return [tool.to_mcp_schema() for tool in self._tools.values()]
+        if self._mcp_cache is None:
+            self._mcp_cache = [tool.to_mcp_schema() for tool in self._tools.values()]
+        return self._mcp_cache
 
     def get_genai_function_declarations(self) -> List[Dict[str, Any]]:
         """
@@ -98,7 +176,11 @@ class ToolRegistry:
         Returns:
             List of tool schemas in GenAI format
         """
-        return [tool.to_genai_function_declaration() for tool in self._tools.values()]
+        if self._genai_cache is None:
+            self._genai_cache = [
+                tool.to_genai_function_declaration() for tool in self._tools.values()
+            ]
+        return self._genai_cache
 
     async def execute_tool(self, name: str, **kwargs) -> Any:
         """
@@ -122,16 +204,95 @@ class ToolRegistry:
                 detail="Tool must be registered before execution"
             )
 
-        logger.info("Executing tool", tool_name=name, parameters=kwargs)
+        # Read-only tools can serve repeated identical calls from cache,
+        # skipping the round-trip entirely
+        cache_key = None
+        if tool.cacheable:
+            try:
+                cache_key = (name, tuple(sorted(kwargs.items())))
+                # Building the tuple succeeds even around list/dict
+                # values — it's hashing that raises — so probe here
+                # before the key reaches the dict lookup below
+                hash(cache_key)
+            except TypeError:
+                # Unhashable parameter values; run uncached
+                cache_key = None
+            else:
+                entry = self._cache.get(cache_key)
+                if entry is not None:
+                    stored_at, value = entry
+                    if time.monotonic() - stored_at < self._cache_ttl:
+                        self._cache.move_to_end(cache_key)
+                        return value
+                    del self._cache[cache_key]
+
+        # Full parameters only at DEBUG; they can be large (scene trees)
+        if _is_enabled(_DEBUG):
+            logger.debug("Executing tool", tool_name=name, parameters=kwargs)
+        elif _is_enabled(_INFO):
+            logger.info("Executing tool", tool_name=name)
 
         try:
             result = await tool.execute(**kwargs)
-            logger.info("Tool execution completed", tool_name=name)
-            return result
+            if _is_enabled(_DEBUG):
+                logger.debug("Tool execution completed", tool_name=name)
         except Exception as e:
             logger.error("Tool execution failed", tool_name=name, error=str(e))
             raise
 
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic(), result)
+            if len(self._cache) > _CACHE_MAX:
+                self._cache.popitem(last=False)
+        return result
+
+    def invalidate_cache(self, name_prefix: Optional[str] = None) -> None:
+        """
+        Drop cached tool results.
+
+        Mutating tools should call this so stale reads aren't served
+        after a scene change.
+
+        Args:
+            name_prefix: Only drop entries whose tool name starts with
+                this prefix; None clears everything
+        """
+        if name_prefix is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[0].startswith(name_prefix)]:
+            del self._cache[key]
+
+    async def execute_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        Execute several tools concurrently.
+
+        Registered tools are I/O-bound (WebSocket round-trips to Kit), so
+        overlapping K calls collapses K sequential round-trips into
+        roughly one.
+
+        Args:
+            calls: List of (tool_name, kwargs) pairs
+
+        Returns:
+            List of results in call order; a failed call yields
+            {"success": False, "error": str} instead of raising, matching
+            the per-tool wrapper behavior
+        """
+        tasks = [
+            asyncio.create_task(self.execute_tool(name, **kwargs))
+            for name, kwargs in calls
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            {"success": False, "error": str(result)}
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
     def discover_tools(self, plugin_path: str) -> int:
         """
         Discover and load tools from a plugin directory.
@@ -152,17 +313,20 @@ class ToolRegistry:
 
     def clear(self) -> None:
         """Clear all registered tools."""
-        count = len(self._tools)
+        count = len(self._tools) + len(self._deferred)
         self._tools.clear()
+        self._deferred.clear()
+        self._mcp_cache = None
+        self._genai_cache = None
         logger.info("Tool registry cleared", tools_removed=count)
 
     def __len__(self) -> int:
-        """Return number of registered tools."""
-        return len(self._tools)
+        """Return number of registered tools, including deferred ones."""
+        return len(self._tools) + len(self._deferred)
 
     def __contains__(self, tool_name: str) -> bool:
-        """Check if tool is registered."""
-        return tool_name in self._tools
+        """Check if tool is registered (materialized or deferred)."""
+        return tool_name in self._tools or tool_name in self._deferred
 
 
 # Global registry instance
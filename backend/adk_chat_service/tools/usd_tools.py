@@ -8,10 +8,24 @@ Reference: https://google.github.io/adk-docs/tools-custom/#example-a-simple-math
 
 from typing import Dict, Any, List, Optional
 
+from ..services.kit_connection import get_kit_manager
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Shared disconnect payload; callers treat tool results as read-only
+# JSON, so one dict serves every tool's disconnect branch
+_NOT_CONNECTED = {"success": False, "error": "Kit is not connected"}
+
+# Prim types create_prim accepts; frozenset for O(1) membership, with
+# the error message rendered once rather than per rejected call
+_VALID_PRIM_TYPES = frozenset({"Cube", "Sphere", "Cylinder", "Cone", "Xform"})
+_INVALID_PRIM_TYPE = {
+    "success": False,
+    "error": "Invalid prim_type. Must be one of: "
+             "['Cube', 'Sphere', 'Cylinder', 'Cone', 'Xform']",
+}
+
 
 async def raycast_from_camera(max_distance: float = 1000.0) -> Dict[str, Any]:
     """
@@ -31,11 +45,9 @@ async def raycast_from_camera(max_distance: float = 1000.0) -> Dict[str, Any]:
             - distance: Distance to the prim (if success)
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
 
     try:
         return await kit_manager.call_tool("raycast_from_camera", {"max_distance": max_distance})
@@ -56,11 +68,9 @@ async def get_selection() -> Dict[str, Any]:
             - selected_prims: List of selected prim info (path, name, type)
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
 
     try:
         return await kit_manager.call_tool("get_selection", {})
@@ -87,11 +97,9 @@ async def get_prim_info(prim_path: str) -> Dict[str, Any]:
             - attributes: Dict of prim attributes
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
 
     try:
         return await kit_manager.call_tool("get_prim_info", {"prim_path": prim_path})
@@ -114,11 +122,9 @@ async def get_camera_info() -> Dict[str, Any]:
             - direction: Dict with x, y, z direction vector
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
 
     try:
         return await kit_manager.call_tool("get_camera_info", {})
@@ -147,16 +153,13 @@ async def create_prim(
             - message: Success message
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
 
     # Validate prim_type
-    valid_types = ["Cube", "Sphere", "Cylinder", "Cone", "Xform"]
-    if prim_type not in valid_types:
-        return {"success": False, "error": f"Invalid prim_type. Must be one of: {valid_types}"}
+    if prim_type not in _VALID_PRIM_TYPES:
+        return _INVALID_PRIM_TYPE
 
     params = {"prim_type": prim_type, "prim_path": prim_path}
     if position is not None:
@@ -169,41 +172,95 @@ async def create_prim(
         return {"success": False, "error": str(e)}
 
 
-async def list_all_prims(root_path: str = "/") -> Dict[str, Any]:
+async def create_prims(prims: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    List all USD prims in the scene under a given root path.
+    Create several USD prims (3D objects) in one batch.
+
+    Prefer this over repeated create_prim calls when creating more than
+    one object: the scene recomposes once for the whole batch instead of
+    once per prim.
+
+    Args:
+        prims: List of prim specs. Each spec is a dict with:
+            - prim_type: One of: Cube, Sphere, Cylinder, Cone, Xform
+            - prim_path: USD path for the new prim (e.g., '/World/MyCube')
+            - position: Optional [x, y, z] position
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if all prims were created
+            - created: List of paths of the created prims
+            - count: Number of prims created
+            - errors: List of per-spec error messages (if any)
+            - error: Error message (if the whole call failed)
+    """
+    kit_manager = get_kit_manager()
+    if not kit_manager.is_connected:
+        return _NOT_CONNECTED
+
+    # Validate prim types up front; one bad spec fails the call before
+    # any round trip rather than partially applying the batch
+    for spec in prims:
+        if spec.get("prim_type") not in _VALID_PRIM_TYPES:
+            return _INVALID_PRIM_TYPE
+
+    try:
+        return await kit_manager.call_tool("create_prims", {"prims": prims})
+    except Exception as e:
+        logger.error(f"create_prims error: {e}")
+        return {"success": False, "error": str(e)}
+
+
+async def list_all_prims(
+    root_path: str = "/",
+    max_results: int = 1000,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    List USD prims in the scene under a given root path, one page at a time.
 
     Useful for understanding scene hierarchy and finding specific prims.
+    Large stages are returned in pages: when a response includes a
+    next_cursor, call this tool again with that cursor to continue.
 
     Args:
         root_path: Root USD path to start listing from (default: '/')
+        max_results: Maximum number of prims per page (default: 1000)
+        cursor: Pass the next_cursor from a previous response to fetch
+            the next page (default: start from the beginning)
 
     Returns:
         Dict containing:
             - success: bool indicating if operation succeeded
             - prims: List of prim info (path, name, type)
-            - count: Number of prims found
+            - count: Number of prims in this page
+            - next_cursor: Cursor for the next page, or None if this
+              page is the last
             - error: Error message (if failed)
     """
-    from ..services.kit_connection import get_kit_manager
-
     kit_manager = get_kit_manager()
     if not kit_manager.is_connected:
-        return {"success": False, "error": "Kit is not connected"}
+        return _NOT_CONNECTED
+
+    params: Dict[str, Any] = {"root_path": root_path, "max_results": max_results}
+    if cursor is not None:
+        params["cursor"] = cursor
 
     try:
-        return await kit_manager.call_tool("list_all_prims", {"root_path": root_path})
+        return await kit_manager.call_tool("list_all_prims", params)
     except Exception as e:
         logger.error(f"list_all_prims error: {e}")
         return {"success": False, "error": str(e)}
 
 
 # List of all USD tools for registration with ADK Agent
-USD_TOOLS = [
+# Immutable registry; the Agent constructor accepts any sequence
+USD_TOOLS = (
     raycast_from_camera,
     get_selection,
     get_prim_info,
     get_camera_info,
     create_prim,
+    create_prims,
     list_all_prims,
-]
+)
@@ -4,6 +4,18 @@
 class BackendError(Exception):
     """Base exception for all backend errors."""
 
+    # message/detail land in slots, so the instance __dict__ is never
+    # materialized on error paths
+    __slots__ = ("message", "detail")
+
+    # Pre-rendered JSON prefix containing the static error-type field, built
+    # once per subclass so HTTP error handlers only serialize dynamic fields.
+    _json_prefix: bytes = b'{"error":"BackendError",'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._json_prefix = b'{"error":"' + cls.__name__.encode("ascii") + b'",'
+
     def __init__(self, message: str, detail: str = None):
         self.message = message
         self.detail = detail
@@ -13,22 +25,24 @@ class BackendError(Exception):
 class ADKClientError(BackendError):
     """Exception raised for errors in the ADK client."""
 
-    pass
+    # Each concrete class declares empty __slots__; a subclass that omits
+    # it re-grows a per-instance __dict__ despite the base declaration
+    __slots__ = ()
 
 
 class ConfigurationError(BackendError):
     """Exception raised for configuration errors."""
 
-    pass
+    __slots__ = ()
 
 
 class StreamingError(BackendError):
     """Exception raised for streaming-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ToolRegistrationError(BackendError):
     """Exception raised for tool registration errors (Phase 2 - MCP)."""
 
-    pass
+    __slots__ = ()
@@ -1,11 +1,23 @@
 """Structured logging configuration for ADK Chat Service."""
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+import orjson
 import structlog
 
+# Background listener draining file-handler writes off the event loop;
+# kept module-global so shutdown can flush and stop it
+_log_listener: Optional[QueueListener] = None
+
+
+def _json_dumps(obj, **_) -> str:
+    """orjson-backed serializer for the JSON renderer (bytes -> str)."""
+    return orjson.dumps(obj, default=str).decode()
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> structlog.BoundLogger:
     """
@@ -25,11 +37,19 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> st
         level=getattr(logging, log_level.upper()),
     )
 
-    # Add file handler if specified
+    # Add file handler if specified; writes go through a queue so disk
+    # I/O happens on the listener thread, never inline with the event loop
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(getattr(logging, log_level.upper()))
-        logging.getLogger().addHandler(file_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        global _log_listener
+        _log_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        logging.getLogger().addHandler(QueueHandler(log_queue))
 
     # Configure structlog processors
     processors = [
@@ -44,7 +64,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> st
     if log_level.upper() == "DEBUG":
         processors.append(structlog.dev.ConsoleRenderer())
     else:
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_json_dumps))
 
     structlog.configure(
         processors=processors,
@@ -59,6 +79,14 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> st
     return structlog.get_logger()
 
 
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 # Global logger instance
 logger: Optional[structlog.BoundLogger] = None
 
@@ -30,15 +30,29 @@ try:
             log_level=settings.log_level
         )
 
-        # SECURITY WARNING: reload=True is for DEVELOPMENT ONLY
-        # Set reload=False for production to prevent exposing file paths in errors
+        # uvloop + httptools (bundled with uvicorn[standard]) cut event-loop
+        # and HTTP-parse overhead on the streaming path; uvloop is not
+        # available on Windows, so fall back to the stdlib loop there
+        try:
+            import uvloop  # noqa: F401
+            loop_impl = "uvloop"
+        except ImportError:
+            loop_impl = "asyncio"
+
+        # Hot reload spawns a watcher process and access logging formats a
+        # line per request (one per streamed response); both are dev-only,
+        # gated on settings.debug. reload=True also exposes file paths in
+        # error pages, so production must keep debug off.
         uvicorn.run(
             "adk_chat_service.main:app",
             host=settings.host,
             port=settings.port,
-            reload=True,  # Enable hot reload for development
+            reload=settings.debug,
             log_level=settings.log_level.lower(),
-            access_log=True
+            access_log=settings.debug,
+            loop=loop_impl,
+            http="httptools",
+            ws="websockets"
         )
 
     if __name__ == "__main__":
@@ -3,9 +3,25 @@
 import aiohttp
 import json
 import asyncio
-from typing import AsyncGenerator, Optional, Dict, Any
+import time
+from typing import AsyncGenerator, Optional, Dict, Any, Tuple
 import carb
 
+# orjson parses NDJSON lines from bytes 2-3x faster than stdlib json;
+# fall back silently when it isn't shipped with the Kit Python
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+
+    def _dumps(obj) -> str:
+        # aiohttp's json_serialize expects str, orjson emits bytes
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+    _dumps = json.dumps
+
 
 class BackendClient:
     """Async HTTP client for communicating with FastAPI backend."""
@@ -19,13 +35,37 @@ class BackendClient:
         self.base_url = base_url
         self.session: Optional[aiohttp.ClientSession] = None
         self._lock = asyncio.Lock()
+        # (checked_at, ok) of the last probe; UI paths poll per render,
+        # so results are served from cache for a short TTL
+        self._last_health: Optional[Tuple[float, bool]] = None
+        self._health_ttl = 2.0
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure aiohttp session is created (lazy initialization)."""
+        # Lock-free fast path: in steady state the session is open, and
+        # asyncio runs this check-and-return without an interleaving await
+        session = self.session
+        if session is not None and not session.closed:
+            return session
+
         async with self._lock:
             if self.session is None or self.session.closed:
                 timeout = aiohttp.ClientTimeout(total=300)  # 5 minute timeout
-                self.session = aiohttp.ClientSession(timeout=timeout)
+                # Keep connections hot between chat messages: reusing the
+                # TCP connection saves handshake plus DNS per request and
+                # avoids TIME_WAIT churn on localhost
+                connector = aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=timeout,
+                    json_serialize=_dumps,
+                )
         return self.session
 
     async def close(self):
@@ -40,13 +80,27 @@ class BackendClient:
         Returns:
             True if backend is healthy, False otherwise
         """
+        cached = self._last_health
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._health_ttl:
+            return cached[1]
+
         try:
             session = await self._ensure_session()
-            async with session.get(f"{self.base_url}/api/v1/health") as response:
-                return response.status == 200
+            # Dedicated short timeout: a down backend should cost ~1s,
+            # not the session-wide streaming timeout
+            async with session.get(
+                f"{self.base_url}/api/v1/health",
+                timeout=aiohttp.ClientTimeout(total=1.0)
+            ) as response:
+                ok = response.status == 200
         except Exception as e:
             carb.log_warn(f"Backend health check failed: {e}")
-            return False
+            ok = False
+
+        # Cache failures too so a down backend isn't re-probed per render
+        self._last_health = (now, ok)
+        return ok
 
     async def stream_chat(
         self,
@@ -98,31 +152,41 @@ class BackendClient:
                     }
                     return
 
-                # Read NDJSON stream line by line
+                # Read NDJSON frames by separator and parse the raw bytes;
+                # no intermediate str decode per line
                 chunk_id = 0
-                async for line in response.content:
-                    line = line.decode('utf-8').strip()
+                content_stream = response.content
+                done = False
+                while not done:
+                    try:
+                        line = await content_stream.readuntil(b"\n")
+                    except asyncio.IncompleteReadError as e:
+                        # Tail without trailing newline at EOF
+                        line = e.partial
+                        done = True
 
+                    line = line.strip()
                     if not line:
+                        if done:
+                            break
                         continue
 
                     try:
-                        data = json.loads(line)
+                        data = _loads(line)
+                    except _JSONDecodeError as e:
+                        carb.log_warn(f"Failed to parse JSON line: {line}, error: {e}")
+                        continue
 
-                        # Add chunk_id if not present
-                        if "chunk_id" not in data:
-                            data["chunk_id"] = chunk_id
-                            chunk_id += 1
+                    # Add chunk_id if not present
+                    if "chunk_id" not in data:
+                        data["chunk_id"] = chunk_id
+                        chunk_id += 1
 
-                        yield data
+                    yield data
 
-                        # Stop if streaming is complete
-                        if data.get("done", False):
-                            break
-
-                    except json.JSONDecodeError as e:
-                        carb.log_warn(f"Failed to parse JSON line: {line}, error: {e}")
-                        continue
+                    # Stop if streaming is complete
+                    if data.get("done", False):
+                        break
 
         except aiohttp.ClientError as e:
             carb.log_error(f"HTTP request failed: {e}")
@@ -160,16 +224,17 @@ class BackendClient:
             Dict containing complete response with 'content' and 'error' fields
         """
         full_content = []
+        append = full_content.append
         error = None
 
         async for chunk in self.stream_chat(message, temperature, max_tokens, conversation_history):
-            if chunk.get("error"):
-                error = chunk["error"]
+            error = chunk.get("error")
+            if error:
                 break
 
-            content = chunk.get("content", "")
+            content = chunk.get("content")
             if content:
-                full_content.append(content)
+                append(content)
 
         return {
             "content": "".join(full_content),
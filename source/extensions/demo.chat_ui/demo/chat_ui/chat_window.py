@@ -4,10 +4,49 @@ import asyncio
 import omni.ui as ui
 import carb
 import carb.settings
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
 
 from .backend_client import BackendClient
-from .message_widget import MessageWidget, StatusIndicator, ToolCallWidget
+from .io_loop import get_io_loop
+from .message_widget import (
+    MessageWidget,
+    StatusIndicator,
+    ToolCallWidget,
+    VirtualMessageList,
+)
+
+
+@dataclass(slots=True)
+class _StreamEvent:
+    """Stream event with fields extracted once at the transport boundary.
+
+    The consumer loop touches several fields per event; doing the dict
+    gets once here (on the I/O thread) leaves only attribute loads on
+    the hot UI-loop path.
+    """
+
+    type: str = ""
+    content: str = ""
+    tool: str = "unknown"
+    call_id: str = ""
+    params: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    error: str = ""
+    done: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_StreamEvent":
+        return cls(
+            type=data.get("type", ""),
+            content=data.get("content", ""),
+            tool=data.get("tool", "unknown"),
+            call_id=data.get("call_id", ""),
+            params=data.get("params"),
+            result=data.get("result"),
+            error=data.get("error") or "",
+            done=data.get("done", False),
+        )
 
 
 class ChatWindow(ui.Window):
@@ -28,6 +67,9 @@ class ChatWindow(ui.Window):
         backend_url = settings.get("/exts/demo.chat_ui/backend_url") or "http://localhost:8000"
         self.default_temperature = settings.get("/exts/demo.chat_ui/default_temperature") or 0.7
         self.default_max_tokens = settings.get("/exts/demo.chat_ui/default_max_tokens") or 2048
+        # Turns sent to the backend per request; the full history stays
+        # in UI memory, but serialization cost stays bounded
+        self._history_window = settings.get("/exts/demo.chat_ui/history_window") or 64
 
         # Initialize backend client
         self.client = BackendClient(base_url=backend_url)
@@ -37,17 +79,38 @@ class ChatWindow(ui.Window):
         self.conversation_history: List[Dict[str, str]] = []
 
         # UI components
-        self._message_container: ui.VStack = None
+        self._message_list: VirtualMessageList = None
         self._input_field: ui.StringField = None
         self._send_button: ui.Button = None
         self._status_indicator: StatusIndicator = None
         self._scroll_frame: ui.ScrollingFrame = None
 
+        # Autoscroll only while the user is pinned near the bottom;
+        # scrolling up to read history releases the pin
+        self._autoscroll_sticky = True
+
         # Streaming state
         self._is_streaming = False
         self._current_assistant_message: MessageWidget = None
         self._tool_widgets: Dict[str, ToolCallWidget] = {}  # call_id -> widget
 
+        # Text deltas buffered between UI flushes; flushed at most once
+        # per frame (~16 ms) so fast token streams don't trigger a layout
+        # pass per token
+        self._pending_delta: List[str] = []
+        self._flush_handle = None
+        self._response_parts: List[str] = []
+
+        # One dict lookup per event instead of walking an if/elif chain
+        # of string compares; handlers return True to end the stream
+        self._stream_handlers = {
+            "text_delta": self._handle_text_delta,
+            "tool_call": self._handle_tool_call,
+            "tool_result": self._handle_tool_result,
+            "end": self._handle_end,
+            "error": self._handle_error,
+        }
+
         # Build UI
         self.frame.set_build_fn(self._build_ui)
 
@@ -65,7 +128,13 @@ class ChatWindow(ui.Window):
                     vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
                 )
                 with self._scroll_frame:
-                    self._message_container = ui.VStack(spacing=10)
+                    # Windowed list: only widgets near the viewport are
+                    # built, so layout cost stays flat as history grows
+                    self._message_list = VirtualMessageList(
+                        self._scroll_frame,
+                        scroll_changed_fn=self._on_user_scroll
+                    )
+                    self._message_list.build()
 
 
                 # Input area
@@ -118,12 +187,14 @@ class ChatWindow(ui.Window):
         """
         # Add user message to UI
         user_msg = MessageWidget("user", message)
-        with self._message_container:
-            user_msg.build()
+        self._message_list.append(user_msg)
         self.messages.append(user_msg)
 
-        # Add to conversation history
-        self.conversation_history.append({"role": "user", "content": message})
+        # Recorded into conversation_history once the request is on the
+        # wire (first event) so the backend sees prior turns only and no
+        # per-send history copy is needed
+        user_turn = {"role": "user", "content": message}
+        user_recorded = False
 
         # Scroll to bottom
         self._scroll_to_bottom()
@@ -135,105 +206,196 @@ class ChatWindow(ui.Window):
 
         # Create assistant message widget
         self._current_assistant_message = MessageWidget("assistant", "")
-        with self._message_container:
-            self._current_assistant_message.build()
+        self._message_list.append(self._current_assistant_message)
         self.messages.append(self._current_assistant_message)
 
         # Stream response with tool support
+        pump_future = None
         try:
-            full_response = ""
+            self._response_parts = []
             self._tool_widgets.clear()
+            handlers = self._stream_handlers
+
+            # Socket reads and NDJSON parsing run on the background I/O
+            # loop; only parsed events cross back to the UI loop, so
+            # rendering never competes with the stream for loop time
+            ui_loop = asyncio.get_event_loop()
+            events: asyncio.Queue = asyncio.Queue()
+            stream_done = object()
+
+            # Bounded snapshot: caps per-request serialization for long
+            # sessions and gives the I/O thread a list the UI loop won't
+            # mutate mid-request
+            history = self.conversation_history[-self._history_window:]
+
+            async def pump():
+                try:
+                    async for event in self.client.stream_chat(
+                        message=message,
+                        temperature=self.default_temperature,
+                        max_tokens=self.default_max_tokens,
+                        conversation_history=history
+                    ):
+                        ui_loop.call_soon_threadsafe(
+                            events.put_nowait, _StreamEvent.from_dict(event)
+                        )
+                except Exception as e:
+                    ui_loop.call_soon_threadsafe(
+                        events.put_nowait,
+                        _StreamEvent(type="error", error=str(e))
+                    )
+                finally:
+                    ui_loop.call_soon_threadsafe(events.put_nowait, stream_done)
+
+            pump_future = get_io_loop().submit(pump())
+
+            while True:
+                event = await events.get()
+                if event is stream_done:
+                    break
 
-            async for event in self.client.stream_chat(
-                message=message,
-                temperature=self.default_temperature,
-                max_tokens=self.default_max_tokens,
-                conversation_history=self.conversation_history[:-1]  # Exclude current message
-            ):
-                event_type = event.get("type", "")
+                if not user_recorded:
+                    # The request payload was serialized before the first
+                    # event could arrive, so appending now is safe
+                    self.conversation_history.append(user_turn)
+                    user_recorded = True
 
-                if event.get("error") and event_type != "tool_result":
-                    error_msg = event["error"]
+                event_type = event.type
+
+                if event.error and event_type != "tool_result":
+                    error_msg = event.error
                     carb.log_error(f"Chat error: {error_msg}")
+                    self._pending_delta.clear()
                     self._current_assistant_message.set_content(f"Error: {error_msg}")
                     self._status_indicator.set_status("error", error_msg)
                     break
 
-                if event_type == "text_delta":
-                    # Text content from LLM
-                    content = event.get("content", "")
-                    if content:
-                        full_response += content
-                        self._current_assistant_message.append_content(content)
-                        self._scroll_to_bottom()
-                    self._status_indicator.set_status("thinking")
-
-                elif event_type == "tool_call":
-                    # Tool is being called
-                    tool_name = event.get("tool", "unknown")
-                    call_id = event.get("call_id", "")
-                    params = event.get("params", {})
-
-                    carb.log_info(f"Tool call: {tool_name} ({call_id})")
-                    self._status_indicator.set_status("tool", f"Using {tool_name}...")
-
-                    # Create tool call widget
-                    tool_widget = ToolCallWidget(tool_name, call_id, params)
-                    with self._message_container:
-                        tool_widget.build()
-                    self._tool_widgets[call_id] = tool_widget
-                    self._scroll_to_bottom()
-
-                elif event_type == "tool_result":
-                    # Tool execution completed
-                    call_id = event.get("call_id", "")
-                    result = event.get("result", {})
-                    success = result.get("success", False)
-
-                    carb.log_info(f"Tool result: {call_id} success={success}")
-
-                    # Update tool widget with result
-                    if call_id in self._tool_widgets:
-                        self._tool_widgets[call_id].set_result(result, success)
-                        self._scroll_to_bottom()
-
-                    self._status_indicator.set_status("thinking")
-
-                elif event_type == "end":
-                    # Streaming complete
-                    self.conversation_history.append({"role": "assistant", "content": full_response})
-                    self._status_indicator.set_status("ready")
-                    break
-
-                elif event_type == "error":
-                    error_msg = event.get("error", "Unknown error")
-                    carb.log_error(f"Stream error: {error_msg}")
-                    self._status_indicator.set_status("error", error_msg)
-                    break
-
+                handler = handlers.get(event_type)
+                if handler is not None:
+                    if handler(event):
+                        break
                 # Legacy support for old format
-                elif event.get("done", False):
-                    self.conversation_history.append({"role": "assistant", "content": full_response})
-                    self._status_indicator.set_status("ready")
+                elif event.done:
+                    self._finish_response()
                     break
 
+                # Cooperative yield (every few chunks) so the tool-client
+                # websocket and health polls aren't starved while a long
+                # response streams
+                if len(self._pending_delta) % 8 == 0:
+                    await asyncio.sleep(0)
+
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             carb.log_error(error_msg)
+            self._pending_delta.clear()
             self._current_assistant_message.set_content(f"Error: {error_msg}")
             self._status_indicator.set_status("error", error_msg)
 
         finally:
+            if pump_future is not None:
+                pump_future.cancel()
+            if not user_recorded:
+                self.conversation_history.append(user_turn)
+            # Drain any buffered deltas before releasing the stream
+            self._flush_stream()
             self._is_streaming = False
             self._send_button.enabled = True
             self._current_assistant_message = None
             self._tool_widgets.clear()
 
+    def _handle_text_delta(self, event: _StreamEvent) -> bool:
+        """Buffer a text delta; the frame timer batches UI updates."""
+        content = event.content
+        if not content:
+            # Empty keep-alive delta; skip the buffer and status writes
+            return False
+        self._response_parts.append(content)
+        self._pending_delta.append(content)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_event_loop().call_later(
+                0.016, self._flush_stream
+            )
+        self._status_indicator.set_status("thinking")
+        return False
+
+    def _handle_tool_call(self, event: _StreamEvent) -> bool:
+        """Show a widget for a tool call in flight."""
+        tool_name = event.tool
+        call_id = event.call_id
+        params = event.params or {}
+
+        carb.log_info(f"Tool call: {tool_name} ({call_id})")
+        self._status_indicator.set_status("tool", f"Using {tool_name}...")
+
+        tool_widget = ToolCallWidget(tool_name, call_id, params)
+        self._message_list.append(tool_widget)
+        self._tool_widgets[call_id] = tool_widget
+        self._scroll_to_bottom()
+        return False
+
+    def _handle_tool_result(self, event: _StreamEvent) -> bool:
+        """Attach a tool result to its in-flight widget."""
+        call_id = event.call_id
+        result = event.result or {}
+        success = result.get("success", False)
+
+        carb.log_info(f"Tool result: {call_id} success={success}")
+
+        tool_widget = self._tool_widgets.get(call_id)
+        if tool_widget is not None:
+            tool_widget.set_result(result, success)
+            self._scroll_to_bottom()
+
+        self._status_indicator.set_status("thinking")
+        return False
+
+    def _handle_end(self, event: _StreamEvent) -> bool:
+        """Record the completed assistant turn."""
+        self._finish_response()
+        return True
+
+    def _handle_error(self, event: _StreamEvent) -> bool:
+        """Surface a stream-level error."""
+        error_msg = event.error or "Unknown error"
+        carb.log_error(f"Stream error: {error_msg}")
+        self._flush_stream()
+        self._status_indicator.set_status("error", error_msg)
+        return True
+
+    def _finish_response(self):
+        """Join buffered reply parts into the conversation history."""
+        self.conversation_history.append(
+            {"role": "assistant", "content": "".join(self._response_parts)}
+        )
+        self._status_indicator.set_status("ready")
+
+    def _flush_stream(self):
+        """Apply buffered text deltas to the UI in a single update."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_delta:
+            return
+        content = "".join(self._pending_delta)
+        self._pending_delta.clear()
+        if self._current_assistant_message:
+            self._current_assistant_message.append_content(content)
+            self._scroll_to_bottom()
+
+    def _on_user_scroll(self, scroll_y: float):
+        """Track whether the view is pinned near the bottom."""
+        max_y = self._scroll_frame.scroll_y_max or 0.0
+        self._autoscroll_sticky = max_y - (scroll_y or 0.0) <= 40.0
+
     def _scroll_to_bottom(self):
-        """Scroll message container to bottom."""
-        if self._scroll_frame:
-            # Force UI update and scroll
-            self._scroll_frame.scroll_y = self._scroll_frame.scroll_y_max
+        """Scroll message container to bottom (only while pinned there)."""
+        if not self._autoscroll_sticky or not self._scroll_frame:
+            return
+        target = self._scroll_frame.scroll_y_max
+        # Skip the redundant property write (each one costs a layout)
+        if self._scroll_frame.scroll_y != target:
+            self._scroll_frame.scroll_y = target
 
     def clear_chat(self):
         """Clear all messages and conversation history."""
@@ -241,8 +403,8 @@ class ChatWindow(ui.Window):
         self.conversation_history.clear()
 
         # Rebuild message container
-        if self._message_container:
-            self._message_container.clear()
+        if self._message_list:
+            self._message_list.clear()
 
         self._status_indicator.set_status("ready")
 
@@ -252,7 +414,8 @@ class ChatWindow(ui.Window):
         Returns:
             True if backend is healthy, False otherwise
         """
-        is_healthy = await self.client.health_check()
+        # Probe runs on the I/O loop; the aiohttp session lives there
+        is_healthy = await get_io_loop().run(self.client.health_check())
 
         if self._status_indicator:  # Defensive check
             if is_healthy:
@@ -268,5 +431,13 @@ class ChatWindow(ui.Window):
 
     def destroy(self):
         """Clean up resources."""
-        asyncio.ensure_future(self.client.close())
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # The session lives on the I/O loop thread, so the close can be
+        # driven to completion from here without deadlocking
+        try:
+            get_io_loop().submit(self.client.close()).result(timeout=2.0)
+        except Exception as e:
+            carb.log_warn(f"Backend client close did not finish cleanly: {e}")
         super().destroy()
@@ -2,12 +2,16 @@
 
 import asyncio
 import omni.ext
+import omni.kit.app
 import omni.ui as ui
 import carb
 import carb.settings
 
-from .chat_window import ChatWindow
-from .kit_tool_client import KitToolClient
+from .io_loop import shutdown_io_loop
+
+# ChatWindow/KitToolClient are imported inside on_startup: they pull in
+# aiohttp, websockets and the USD tool stack, which would otherwise load
+# during Kit's synchronous extension scan
 
 
 class ChatUIExtension(omni.ext.IExt):
@@ -16,8 +20,9 @@ class ChatUIExtension(omni.ext.IExt):
     def __init__(self):
         """Initialize extension."""
         super().__init__()
-        self._window: ChatWindow = None
-        self._tool_client: KitToolClient = None
+        self._window = None
+        self._tool_client = None
+        self._first_update_sub = None
 
     def on_startup(self, ext_id: str):
         """Called when extension starts.
@@ -27,6 +32,9 @@ class ChatUIExtension(omni.ext.IExt):
         """
         carb.log_info("[demo.chat_ui] Extension startup")
 
+        from .chat_window import ChatWindow
+        from .kit_tool_client import KitToolClient
+
         # Get settings
         settings = carb.settings.get_settings()
         backend_url = settings.get("/exts/demo.chat_ui/backend_url") or "http://localhost:8000"
@@ -42,17 +50,19 @@ class ChatUIExtension(omni.ext.IExt):
         # Create chat window
         self._window = ChatWindow(title="LLM Chat", width=500, height=600)
 
-        # Check backend health on startup (delayed to allow UI to build)
-        async def delayed_check():
-            await asyncio.sleep(0.1)  # Wait for UI to build
-            await self._check_backend()
-        asyncio.ensure_future(delayed_check())
+        # Check backend health once the UI has had a frame to build;
+        # the first app update fires as soon as that happens, without
+        # a hardcoded wait
+        self._first_update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(
+                self._on_first_update, name="chat_ui.first_update"
+            )
+        )
 
         # Register window menu
-        ui.Workspace.set_show_window_fn(
-            "LLM Chat",
-            lambda visible: self._set_window_visibility(visible)
-        )
+        ui.Workspace.set_show_window_fn("LLM Chat", self._set_window_visibility)
 
         carb.log_info("[demo.chat_ui] Extension started successfully")
 
@@ -60,9 +70,13 @@ class ChatUIExtension(omni.ext.IExt):
         """Called when extension shuts down."""
         carb.log_info("[demo.chat_ui] Extension shutdown")
 
-        # Stop tool client
+        # Drop the one-shot update subscription if it never fired
+        self._first_update_sub = None
+
+        # Stop tool client; drive the coroutine to completion when the
+        # loop allows so sockets don't leak across extension reloads
         if self._tool_client:
-            asyncio.ensure_future(self._tool_client.stop())
+            self._run_cleanup(self._tool_client.stop())
             self._tool_client = None
 
         # Clean up window
@@ -73,8 +87,32 @@ class ChatUIExtension(omni.ext.IExt):
         # Unregister window menu
         ui.Workspace.set_show_window_fn("LLM Chat", None)
 
+        # Stop the background network loop (started lazily by the client)
+        shutdown_io_loop()
+
         carb.log_info("[demo.chat_ui] Extension shutdown complete")
 
+    def _on_first_update(self, _event):
+        """Kick off the backend health check after the first frame."""
+        self._first_update_sub = None  # One-shot
+        asyncio.ensure_future(self._check_backend())
+
+    def _run_cleanup(self, coro):
+        """Run a cleanup coroutine as close to synchronously as possible.
+
+        When Kit's loop is idle the coroutine completes before returning;
+        when called from inside the running loop, blocking on it would
+        deadlock, so it is scheduled as a task instead.
+
+        Args:
+            coro: Cleanup coroutine to run
+        """
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            asyncio.ensure_future(coro)
+        else:
+            loop.run_until_complete(coro)
+
     async def _check_backend(self):
         """Check backend health on startup."""
         if self._window:
@@ -0,0 +1,93 @@
+"""Background asyncio loop for network I/O.
+
+Kit runs extension coroutines on the main UI event loop, so socket reads
+and response parsing compete with rendering for the same loop. This
+module owns a daemon thread running its own asyncio loop; network
+coroutines are submitted there and results are marshaled back to the
+caller's loop.
+"""
+
+import asyncio
+import threading
+from typing import Optional
+
+# Kit owns the main loop, so uvloop can't be installed there — but this
+# thread builds its own loop and can use the faster implementation when
+# it's available
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+class IOLoop:
+    """Thread-backed asyncio loop for off-UI-thread network work."""
+
+    def __init__(self, name: str = "chat_ui_io"):
+        """Start the loop thread.
+
+        Args:
+            name: Thread name, for profiler/debugger readability
+        """
+        self._loop = _new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The underlying event loop (for call_soon_threadsafe etc.)."""
+        return self._loop
+
+    def submit(self, coro):
+        """Schedule a coroutine on the I/O loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future resolving with the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def run(self, coro):
+        """Run a coroutine on the I/O loop and await it from another loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def stop(self):
+        """Stop the loop thread and release its resources."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5.0)
+        self._loop.close()
+
+
+# Shared instance, started lazily on first network use and stopped by the
+# extension on shutdown
+_io_loop: Optional[IOLoop] = None
+
+
+def get_io_loop() -> IOLoop:
+    """Get the shared I/O loop, starting it on first use."""
+    global _io_loop
+    if _io_loop is None:
+        _io_loop = IOLoop()
+    return _io_loop
+
+
+def shutdown_io_loop():
+    """Stop the shared I/O loop if it was started."""
+    global _io_loop
+    if _io_loop is not None:
+        _io_loop.stop()
+        _io_loop = None
@@ -2,12 +2,50 @@
 
 import asyncio
 import json
+import random
 import uuid
 import carb
 from typing import Dict, Any, Callable, Optional
 
 from .usd_tools import USDTools
 
+# orjson handles the per-frame serialize/parse work in C and emits
+# bytes frames directly; fall back silently when it isn't shipped
+# with the Kit Python
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Results carrying more prims than this are streamed in chunks instead
+# of serialized as one frame, bounding peak memory on large stages
+_RESULT_CHUNK_THRESHOLD = 500
+_RESULT_CHUNK_SIZE = 256
+
+# Constant JSON-RPC envelope for status notifications; only the params
+# object is serialized per event, spliced between the baked prefix and
+# closing brace (same trick the backend uses for call frames)
+_STATUS_PREFIX = b'{"jsonrpc":"2.0","method":"tool.status","params":'
+
+# Shared empty params for calls that omit the field; read-only by
+# convention (thunks only .get from it)
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
+
+def _status_frame(call_id, status: str, message: str) -> bytes:
+    return (
+        _STATUS_PREFIX
+        + _dumps({"call_id": call_id, "status": status, "message": message})
+        + b"}"
+    )
+
 
 class KitToolClient:
     """
@@ -41,26 +79,50 @@ class KitToolClient:
         self._reconnect_task: Optional[asyncio.Task] = None
         self._current_delay = reconnect_delay
 
-        # Tool registry mapping tool names to methods
-        self.tool_registry: Dict[str, Callable] = {
-            "raycast_from_camera": self.tools.raycast_from_camera,
-            "get_selection": self.tools.get_selection,
-            "get_prim_info": self.tools.get_prim_info,
-            "get_camera_info": self.tools.get_camera_info,
-            "create_prim": self.tools.create_prim,
-            "list_all_prims": self.tools.list_all_prims,
+        # Outbound frames funnel through a queue drained by a writer
+        # task; back-to-back messages (status then result) coalesce
+        # into one newline-joined frame and one send
+        self._out_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # Last status frame sent, to drop byte-identical repeats (same
+        # call, same status, same message) without a serialize or send
+        self._last_status_frame: Optional[bytes] = None
+
+        # Per-tool thunks taking the raw params dict and calling with
+        # positional arguments; skips ** unpacking and keyword binding
+        # on every dispatch
+        tools = self.tools
+        self.tool_registry: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "raycast_from_camera":
+                lambda p: tools.raycast_from_camera(p.get("max_distance", 1000.0)),
+            "get_selection": lambda p: tools.get_selection(),
+            "get_prim_info": lambda p: tools.get_prim_info(p["prim_path"]),
+            "get_camera_info": lambda p: tools.get_camera_info(),
+            "create_prim":
+                lambda p: tools.create_prim(
+                    p["prim_type"], p["prim_path"], p.get("position")
+                ),
+            "create_prims": lambda p: tools.create_prims(p["prims"]),
+            "list_all_prims": lambda p: tools.list_all_prims(
+                p.get("root_path", "/"), p.get("max_results", 1000), p.get("cursor")
+            ),
         }
 
     async def start(self):
         """Start the WebSocket client and connect to backend."""
         self._running = True
         self._current_delay = self.reconnect_delay
+        self._writer_task = asyncio.ensure_future(self._writer_loop())
         await self._connect()
 
     async def stop(self):
         """Stop the WebSocket client."""
         self._running = False
 
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+
         if self._reconnect_task:
             self._reconnect_task.cancel()
             self._reconnect_task = None
@@ -78,11 +140,25 @@ class KitToolClient:
 
             carb.log_info(f"[Kit Tool Client] Connecting to {self.backend_url}")
 
-            self.websocket = await websockets.connect(self.backend_url)
+            # permessage-deflate costs CPU per frame and buys nothing on
+            # a localhost link; the larger max_size covers big (chunked)
+            # tool results without reallocation
+            self.websocket = await websockets.connect(
+                self.backend_url,
+                compression=None,
+                max_size=2 ** 24,
+            )
             self._current_delay = self.reconnect_delay  # Reset delay on successful connection
+            self._last_status_frame = None  # Fresh connection, no dedupe history
 
             carb.log_info("[Kit Tool Client] Connected to backend")
 
+            # Resurrect the writer if a previous incarnation died; a dead
+            # writer means nothing drains the queue and registration
+            # never reaches the backend
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.ensure_future(self._writer_loop())
+
             # Send registration message with available tools
             await self._send_registration()
 
@@ -101,10 +177,13 @@ class KitToolClient:
         if not self._running:
             return
 
-        carb.log_info(f"[Kit Tool Client] Reconnecting in {self._current_delay}s...")
+        # Jittered delay (0.5x-1.5x) so Kit instances restarted together
+        # don't stampede the backend in lockstep
+        delay = self._current_delay * (0.5 + random.random())
+        carb.log_info(f"[Kit Tool Client] Reconnecting in {delay:.1f}s...")
 
         async def reconnect():
-            await asyncio.sleep(self._current_delay)
+            await asyncio.sleep(delay)
             # Exponential backoff
             self._current_delay = min(self._current_delay * 2, self.max_reconnect_delay)
             await self._connect()
@@ -113,25 +192,28 @@ class KitToolClient:
 
     async def _send_registration(self):
         """Send tool registration message to backend."""
-        registration = {
-            "jsonrpc": "2.0",
-            "method": "kit.register",
-            "params": {
-                "tools": self._get_tool_schemas()
-            }
-        }
-
-        await self._send(registration)
+        # Pre-serialized at import; reconnects pay no dict build or dump
+        self._out_queue.put_nowait(_REGISTRATION_BYTES)
         carb.log_info("[Kit Tool Client] Sent tool registration")
 
     async def _message_loop(self):
         """Handle incoming messages from backend."""
         try:
             async for message in self.websocket:
+                # Frames without an "id" field are notifications we only
+                # log; a C-level substring scan beats a full parse. The
+                # backend appends id last in request frames, so the scan
+                # covers the whole frame, not just a head slice
+                needle = b'"id"' if isinstance(message, (bytes, bytearray)) else '"id"'
+                if needle not in message:
+                    carb.log_info("[Kit Tool Client] Ignored notification frame")
+                    continue
+
                 try:
-                    data = json.loads(message)
+                    # Accepts str or bytes; no decode needed either way
+                    data = _loads(message)
                     await self._handle_message(data)
-                except json.JSONDecodeError as e:
+                except _JSONDecodeError as e:
                     carb.log_error(f"[Kit Tool Client] Invalid JSON: {e}")
 
         except Exception as e:
@@ -149,62 +231,146 @@ class KitToolClient:
         """
         # Check if it's a JSON-RPC 2.0 request (has method and id)
         if "method" in data and "id" in data:
-            await self._handle_tool_call(data)
+            # Run as its own task so the message loop keeps reading
+            # frames while a call awaits sends; execution itself stays
+            # on this thread — USD/Kit APIs are main-thread bound.
+            # Fields are unpacked here, once, and travel positionally.
+            asyncio.ensure_future(self._handle_tool_call(
+                data["method"], data.get("params") or _EMPTY_PARAMS, data["id"]
+            ))
         elif "method" in data:
             # Notification (no id) - just log it
             carb.log_info(f"[Kit Tool Client] Received notification: {data.get('method')}")
         else:
             carb.log_warn(f"[Kit Tool Client] Unknown message format: {data}")
 
-    async def _handle_tool_call(self, request: Dict[str, Any]):
+    async def _handle_tool_call(self, method: str, params: Dict[str, Any], call_id):
         """
         Handle a tool call request from backend.
 
         Args:
-            request: JSON-RPC 2.0 request with method, params, and id
+            method: Tool name from the JSON-RPC request
+            params: Tool parameters (shared empty dict when omitted)
+            call_id: JSON-RPC request id to echo in the response
         """
-        method = request.get("method")
-        params = request.get("params", {})
-        call_id = request.get("id")
-
         carb.log_info(f"[Kit Tool Client] Tool call: {method} (id={call_id})")
 
-        # Send status update
-        await self._send_status(call_id, "running", f"Executing {method}...")
-
-        try:
-            if method not in self.tool_registry:
-                # Method not found error
-                await self._send_error(call_id, -32601, f"Method not found: {method}")
-                return
+        tool_func = self.tool_registry.get(method)
+        if tool_func is None:
+            # Method not found error
+            await self._send_error(call_id, -32601, f"Method not found: {method}")
+            return
 
-            # Execute tool
-            tool_func = self.tool_registry[method]
+        # The 'running' status frame goes out only if the call is still
+        # in flight after 10 ms; fast tools skip the extra frame (the
+        # result follows immediately anyway)
+        status_handle = asyncio.get_event_loop().call_later(
+            0.01,
+            lambda: self._enqueue_status(
+                _status_frame(call_id, "running", f"Executing {method}...")
+            )
+        )
 
-            if params:
-                result = tool_func(**params)
-            else:
-                result = tool_func()
+        try:
+            # Execute tool; async tools (hardware raycast) yield a
+            # coroutine that resolves on this loop
+            result = tool_func(params)
+            if asyncio.iscoroutine(result):
+                result = await result
 
             # Send result
             await self._send_result(call_id, result)
             carb.log_info(f"[Kit Tool Client] Tool completed: {method} success={result.get('success', False)}")
 
-        except TypeError as e:
+        except (KeyError, TypeError) as e:
             # Invalid params error
             await self._send_error(call_id, -32602, f"Invalid params: {str(e)}")
         except Exception as e:
             # Tool execution error
             carb.log_error(f"[Kit Tool Client] Tool error: {e}")
             await self._send_error(call_id, -32000, str(e))
+        finally:
+            status_handle.cancel()
+
+    async def _writer_loop(self):
+        """Drain the outbound queue, coalescing ready frames.
+
+        Messages queued back-to-back (a status update followed by the
+        result) go out as one newline-joined frame and one send; the
+        backend splits frames on newlines. A lone message still costs
+        a single send.
+
+        The loop survives individual send failures: a frame that can't
+        be delivered (connection dropped mid-send, or not yet
+        re-established) is re-queued and retried after a short pause,
+        so queued registration and results aren't lost across a
+        reconnect. Only cancellation from stop() ends the loop.
+        """
+        while True:
+            frame = await self._out_queue.get()
+            if not self._out_queue.empty():
+                batch = [frame]
+                while not self._out_queue.empty():
+                    batch.append(self._out_queue.get_nowait())
+                frame = b"\n".join(batch)
+            websocket = self.websocket
+            if websocket is None:
+                # Disconnected: hold the frame for the next connection
+                # rather than dropping it on the floor (the joined frame
+                # re-splits fine on the backend)
+                self._out_queue.put_nowait(frame)
+                await asyncio.sleep(0.5)
+                continue
+            try:
+                await websocket.send(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                carb.log_warn(
+                    f"[Kit Tool Client] Send failed, re-queuing frame: {e}"
+                )
+                self._out_queue.put_nowait(frame)
+                await asyncio.sleep(0.5)
 
     async def _send(self, data: Dict[str, Any]):
-        """Send JSON message to backend."""
-        if self.websocket:
-            await self.websocket.send(json.dumps(data))
+        """Queue a JSON message for the writer loop."""
+        # Bytes frame; skips the str->bytes copy inside websockets
+        self._out_queue.put_nowait(_dumps(data))
 
     async def _send_result(self, call_id: str, result: Dict[str, Any]):
-        """Send successful tool result."""
+        """Send successful tool result.
+
+        Large prim listings go out as a begin/chunk/end notification
+        sequence (reassembled by the backend) so a stage with thousands
+        of prims is serialized a slice at a time and overlaps with
+        socket drain instead of materializing one huge frame.
+        """
+        prims = result.get("prims") if isinstance(result, dict) else None
+        if prims is not None and len(prims) > _RESULT_CHUNK_THRESHOLD:
+            meta = {k: v for k, v in result.items() if k != "prims"}
+            await self._send({
+                "jsonrpc": "2.0",
+                "method": "tool.result_begin",
+                "params": {"call_id": call_id, "meta": meta}
+            })
+            for start in range(0, len(prims), _RESULT_CHUNK_SIZE):
+                await self._send({
+                    "jsonrpc": "2.0",
+                    "method": "tool.result_chunk",
+                    "params": {
+                        "call_id": call_id,
+                        "prims": prims[start:start + _RESULT_CHUNK_SIZE]
+                    }
+                })
+                # Let the writer drain between slices
+                await asyncio.sleep(0)
+            await self._send({
+                "jsonrpc": "2.0",
+                "method": "tool.result_end",
+                "params": {"call_id": call_id}
+            })
+            return
+
         response = {
             "jsonrpc": "2.0",
             "result": result,
@@ -224,18 +390,22 @@ class KitToolClient:
         }
         await self._send(response)
 
+    def _enqueue_status(self, frame: bytes):
+        """Queue a status frame unless it repeats the previous one.
+
+        Status notifications are advisory, so a byte-identical repeat
+        carries no information and can be dropped before it costs a
+        queue slot and a WS frame.
+        """
+        if frame == self._last_status_frame:
+            return
+        self._last_status_frame = frame
+        self._out_queue.put_nowait(frame)
+
     async def _send_status(self, call_id: str, status: str, message: str):
         """Send status update notification."""
-        notification = {
-            "jsonrpc": "2.0",
-            "method": "tool.status",
-            "params": {
-                "call_id": call_id,
-                "status": status,
-                "message": message
-            }
-        }
-        await self._send(notification)
+        # Envelope is baked; only the params object is serialized
+        self._enqueue_status(_status_frame(call_id, status, message))
 
     def _get_tool_schemas(self) -> list:
         """
@@ -244,7 +414,12 @@ class KitToolClient:
         Returns:
             List of tool schemas in JSON Schema format
         """
-        return [
+        return _TOOL_SCHEMAS
+
+
+# Static tool catalog; built once so reconnects (which re-register on
+# every attempt under backoff) don't rebuild the dict tree
+_TOOL_SCHEMAS = [
             {
                 "name": "raycast_from_camera",
                 "description": "Perform raycast from the viewport camera center to find what prim is in the camera's view. Returns the closest prim the camera is pointing at.",
@@ -313,9 +488,43 @@ class KitToolClient:
                     "required": ["prim_type", "prim_path"]
                 }
             },
+            {
+                "name": "create_prims",
+                "description": "Create several USD prims in one batch. Faster than repeated create_prim calls because the stage recomposes once for the whole batch.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "prims": {
+                            "type": "array",
+                            "description": "List of prims to create",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "prim_type": {
+                                        "type": "string",
+                                        "description": "Type of prim to create",
+                                        "enum": ["Cube", "Sphere", "Cylinder", "Cone", "Xform"]
+                                    },
+                                    "prim_path": {
+                                        "type": "string",
+                                        "description": "USD path for the new prim"
+                                    },
+                                    "position": {
+                                        "type": "array",
+                                        "description": "Optional [x, y, z] position",
+                                        "items": {"type": "number"}
+                                    }
+                                },
+                                "required": ["prim_type", "prim_path"]
+                            }
+                        }
+                    },
+                    "required": ["prims"]
+                }
+            },
             {
                 "name": "list_all_prims",
-                "description": "List all USD prims in the scene under a given root path. Useful for understanding scene hierarchy.",
+                "description": "List USD prims in the scene under a given root path, one page at a time. Useful for understanding scene hierarchy; pass the returned next_cursor to fetch the next page.",
                 "parameters": {
                     "type": "object",
                     "properties": {
@@ -323,8 +532,25 @@ class KitToolClient:
                             "type": "string",
                             "description": "Root USD path to start listing from",
                             "default": "/"
+                        },
+                        "max_results": {
+                            "type": "number",
+                            "description": "Maximum prims per page",
+                            "default": 1000
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "next_cursor from a previous page, to resume listing"
                         }
                     }
                 }
             }
         ]
+
+# Registration frame pre-serialized once; reconnects just enqueue the
+# same bytes
+_REGISTRATION_BYTES = _dumps({
+    "jsonrpc": "2.0",
+    "method": "kit.register",
+    "params": {"tools": _TOOL_SCHEMAS}
+})
@@ -3,6 +3,56 @@
 import omni.ui as ui
 from typing import Literal
 
+# Colors and style dicts shared by every widget instance; built once at
+# import so rebuilding hundreds of messages doesn't re-allocate them
+_USER_BG = ui.color(0.2, 0.4, 0.8, 0.3)  # Blue tint
+_ASSIST_BG = ui.color(0.3, 0.3, 0.3, 0.3)  # Gray tint
+_MSG_BORDER = ui.color(0.4, 0.4, 0.4, 0.5)
+_MSG_RECT_STYLE_USER = {
+    "background_color": _USER_BG,
+    "border_radius": 8,
+    "border_width": 1,
+    "border_color": _MSG_BORDER,
+}
+_MSG_RECT_STYLE_ASSIST = {
+    "background_color": _ASSIST_BG,
+    "border_radius": 8,
+    "border_width": 1,
+    "border_color": _MSG_BORDER,
+}
+_MSG_LABEL_STYLE = {"font_size": 16, "color": ui.color(0.9, 0.9, 0.9, 1.0)}
+
+_TOOL_RECT_STYLE = {
+    "background_color": ui.color(0.4, 0.3, 0.5, 0.4),  # Purple tint
+    "border_radius": 6,
+    "border_width": 1,
+    "border_color": ui.color(0.5, 0.4, 0.6, 0.6),
+}
+_TOOL_NAME_STYLE = {"font_size": 14, "color": ui.color(0.7, 0.8, 1.0, 1.0)}
+_TOOL_STATUS_RUNNING_STYLE = {"font_size": 12, "color": ui.color(0.8, 0.7, 0.3, 1.0)}
+_TOOL_STATUS_OK_STYLE = {"font_size": 12, "color": ui.color(0.3, 0.8, 0.3, 1.0)}
+_TOOL_STATUS_FAIL_STYLE = {"font_size": 12, "color": ui.color(0.8, 0.3, 0.3, 1.0)}
+_TOOL_RESULT_STYLE = {"font_size": 12, "color": ui.color(0.7, 0.7, 0.7, 1.0)}
+
+_STATUS_LABEL_STYLE = {"font_size": 16, "color": ui.color(0.8, 0.8, 0.8, 1.0)}
+_STATUS_COLORS = {
+    "ready": ui.color(0.3, 0.8, 0.3, 1.0),  # Green
+    "thinking": ui.color(0.8, 0.6, 0.2, 1.0),  # Orange
+    "tool": ui.color(0.5, 0.4, 0.8, 1.0),  # Purple
+    "error": ui.color(0.8, 0.2, 0.2, 1.0),  # Red
+}
+# Circle styles per status, so set_status never builds a dict per call
+_STATUS_CIRCLE_STYLES = {
+    status: {"background_color": color} for status, color in _STATUS_COLORS.items()
+}
+_STATUS_CIRCLE_IDLE = {"background_color": ui.color(0.5, 0.5, 0.5, 1.0)}
+_STATUS_DEFAULT_MSG = {
+    "ready": "Ready",
+    "thinking": "Thinking...",
+    "tool": "Using tool...",
+    "error": "Error",
+}
+
 
 class MessageWidget:
     """Widget for displaying a single chat message with streaming support."""
@@ -19,16 +69,25 @@ class MessageWidget:
             initial_content: Initial message content
         """
         self.message_type = message_type
-        self._content = initial_content
+        # Content lives as a chunk list; joins happen lazily (and only
+        # when a label actually needs the text), so streaming appends
+        # never rebuild the whole string
+        self._parts = [initial_content] if initial_content else []
+        self._cached_content = initial_content
+        self._dirty = False
         self._label: ui.Label = None
+        # The label's string model, cached at build time; streaming
+        # writes go through model.set_value directly instead of the
+        # Label.text property descriptor
+        self._model = None
 
-        # Style configuration
+        # Style configuration: pick the shared precomputed dict
         if message_type == "user":
-            self.bg_color = ui.color(0.2, 0.4, 0.8, 0.3)  # Blue tint
+            self._rect_style = _MSG_RECT_STYLE_USER
             self.alignment = ui.Alignment.RIGHT
             self.h_alignment = ui.Alignment.RIGHT_CENTER
         else:
-            self.bg_color = ui.color(0.3, 0.3, 0.3, 0.3)  # Gray tint
+            self._rect_style = _MSG_RECT_STYLE_ASSIST
             self.alignment = ui.Alignment.LEFT
             self.h_alignment = ui.Alignment.LEFT_CENTER
 
@@ -46,14 +105,7 @@ class MessageWidget:
 
                 with ui.ZStack(height=0):
                     # Background rectangle
-                    ui.Rectangle(
-                        style={
-                            "background_color": self.bg_color,
-                            "border_radius": 8,
-                            "border_width": 1,
-                            "border_color": ui.color(0.4, 0.4, 0.4, 0.5)
-                        }
-                    )
+                    ui.Rectangle(style=self._rect_style)
 
                     # Message content
                     with ui.VStack(spacing=0, height=0):
@@ -61,13 +113,10 @@ class MessageWidget:
                         with ui.HStack(height=0):
                             ui.Spacer(width=12)
                             self._label = ui.Label(
-                                self._content,
+                                self.content,
                                 word_wrap=True,
                                 alignment=self.h_alignment,
-                                style={
-                                    "font_size": 16,
-                                    "color": ui.color(0.9, 0.9, 0.9, 1.0)
-                                }
+                                style=_MSG_LABEL_STYLE
                             )
                             ui.Spacer(width=12)
                         ui.Spacer(height=6)
@@ -75,6 +124,7 @@ class MessageWidget:
                 if self.message_type == "assistant":
                     ui.Spacer(width=ui.Percent(20))
 
+        self._model = self._label.model
         return frame
 
     def append_content(self, content: str):
@@ -83,9 +133,10 @@ class MessageWidget:
         Args:
             content: Text to append
         """
-        self._content += content
-        if self._label:
-            self._label.text = self._content
+        self._parts.append(content)
+        self._dirty = True
+        if self._model:
+            self._model.set_value(self.content)
 
     def set_content(self, content: str):
         """Replace entire message content.
@@ -93,14 +144,58 @@ class MessageWidget:
         Args:
             content: New message content
         """
-        self._content = content
-        if self._label:
-            self._label.text = self._content
+        self._parts = [content]
+        self._cached_content = content
+        self._dirty = False
+        if self._model:
+            self._model.set_value(content)
+
+    def release(self):
+        """Drop UI references when the widget scrolls out of the window.
+
+        Content is kept on the model side; build() re-creates the labels
+        if the widget scrolls back into view.
+        """
+        self._label = None
+        self._model = None
 
     @property
     def content(self) -> str:
-        """Get current message content."""
-        return self._content
+        """Get current message content (joined lazily)."""
+        if self._dirty:
+            self._cached_content = "".join(self._parts)
+            self._dirty = False
+        return self._cached_content
+
+
+def _fmt_position(result: dict) -> str:
+    pos = result.get("position") or {}
+    return f"→ Position: ({pos.get('x', 0):.1f}, {pos.get('y', 0):.1f}, {pos.get('z', 0):.1f})"
+
+
+def _fmt_default(result: dict) -> str:
+    """Key-sniffing fallback for tools without a dedicated formatter."""
+    if "prim_path" in result:
+        return f"→ {result['prim_path']}"
+    if "selected_prims" in result:
+        return f"→ {len(result['selected_prims'])} prim(s) selected"
+    if "prims" in result:
+        return f"→ {result.get('count', len(result['prims']))} prim(s) found"
+    if "position" in result:
+        return _fmt_position(result)
+    return "→ Success"
+
+
+# Result summary per tool name: one dict lookup plus one formatter call
+# instead of probing the result dict key by key
+_RESULT_FORMATTERS = {
+    "create_prim": lambda r: f"→ {r.get('prim_path', '')}",
+    "get_prim_info": lambda r: f"→ {r.get('prim_path', '')}",
+    "get_selection": lambda r: f"→ {len(r.get('selected_prims', ()))} prim(s) selected",
+    "list_all_prims": lambda r: f"→ {r.get('count', len(r.get('prims', ())))} prim(s) found",
+    "raycast_from_camera": _fmt_position,
+    "get_camera_info": _fmt_position,
+}
 
 
 class ToolCallWidget:
@@ -135,14 +230,7 @@ class ToolCallWidget:
 
                 with ui.ZStack(height=0):
                     # Background with special tool color
-                    ui.Rectangle(
-                        style={
-                            "background_color": ui.color(0.4, 0.3, 0.5, 0.4),  # Purple tint
-                            "border_radius": 6,
-                            "border_width": 1,
-                            "border_color": ui.color(0.5, 0.4, 0.6, 0.6)
-                        }
-                    )
+                    ui.Rectangle(style=_TOOL_RECT_STYLE)
 
                     with ui.VStack(spacing=2, height=0):
                         ui.Spacer(height=4)
@@ -152,18 +240,12 @@ class ToolCallWidget:
                             ui.Spacer(width=8)
                             ui.Label(
                                 f"🔧 {self.tool_name}",
-                                style={
-                                    "font_size": 14,
-                                    "color": ui.color(0.7, 0.8, 1.0, 1.0)
-                                }
+                                style=_TOOL_NAME_STYLE
                             )
                             ui.Spacer(width=10)
                             self._status_label = ui.Label(
                                 "⏳ Running...",
-                                style={
-                                    "font_size": 12,
-                                    "color": ui.color(0.8, 0.7, 0.3, 1.0)
-                                }
+                                style=_TOOL_STATUS_RUNNING_STYLE
                             )
                             ui.Spacer(width=8)
 
@@ -173,10 +255,7 @@ class ToolCallWidget:
                             self._result_label = ui.Label(
                                 "",
                                 word_wrap=True,
-                                style={
-                                    "font_size": 12,
-                                    "color": ui.color(0.7, 0.7, 0.7, 1.0)
-                                }
+                                style=_TOOL_RESULT_STYLE
                             )
                             ui.Spacer(width=8)
 
@@ -184,8 +263,17 @@ class ToolCallWidget:
 
                 ui.Spacer(width=ui.Percent(5))
 
+        # Re-apply a result that arrived while the widget was released
+        if self._result is not None:
+            self.set_result(self._result, self._status == "completed")
+
         return frame
 
+    def release(self):
+        """Drop UI references when the widget scrolls out of the window."""
+        self._status_label = None
+        self._result_label = None
+
     def set_result(self, result: dict, success: bool = True):
         """Set the tool call result.
 
@@ -199,38 +287,132 @@ class ToolCallWidget:
         if self._status_label:
             if success:
                 self._status_label.text = "✓ Done"
-                self._status_label.set_style({
-                    "font_size": 12,
-                    "color": ui.color(0.3, 0.8, 0.3, 1.0)
-                })
+                self._status_label.set_style(_TOOL_STATUS_OK_STYLE)
             else:
                 self._status_label.text = "✗ Failed"
-                self._status_label.set_style({
-                    "font_size": 12,
-                    "color": ui.color(0.8, 0.3, 0.3, 1.0)
-                })
+                self._status_label.set_style(_TOOL_STATUS_FAIL_STYLE)
 
         if self._result_label and result:
             # Show summary of result
             if success and result.get("success"):
-                if "prim_path" in result:
-                    self._result_label.text = f"→ {result['prim_path']}"
-                elif "selected_prims" in result:
-                    count = len(result["selected_prims"])
-                    self._result_label.text = f"→ {count} prim(s) selected"
-                elif "prims" in result:
-                    count = result.get("count", len(result["prims"]))
-                    self._result_label.text = f"→ {count} prim(s) found"
-                elif "position" in result:
-                    pos = result["position"]
-                    self._result_label.text = f"→ Position: ({pos.get('x', 0):.1f}, {pos.get('y', 0):.1f}, {pos.get('z', 0):.1f})"
-                else:
-                    self._result_label.text = "→ Success"
+                fmt = _RESULT_FORMATTERS.get(self.tool_name, _fmt_default)
+                self._result_label.text = fmt(result)
             else:
                 error = result.get("error", "Unknown error")
                 self._result_label.text = f"→ Error: {error}"
 
 
+class VirtualMessageList:
+    """Windowed message container that only materializes visible widgets.
+
+    Widgets (MessageWidget/ToolCallWidget) hold their own model state, so
+    only the slice intersecting the scroll viewport (plus a small buffer)
+    is built into the UI tree; everything else is represented by spacer
+    pads that preserve scrollbar geometry. This keeps layout/repaint cost
+    O(visible) instead of O(messages) as a conversation grows.
+    """
+
+    def __init__(
+        self,
+        scroll_frame: ui.ScrollingFrame,
+        item_height: int = 56,
+        spacing: int = 10,
+        buffer_items: int = 4,
+        scroll_changed_fn=None
+    ):
+        """Initialize the virtual list.
+
+        Args:
+            scroll_frame: Scrolling frame hosting the list
+            item_height: Estimated height of one message in pixels; used
+                for windowing math and spacer pads
+            spacing: Vertical spacing between messages in pixels
+            buffer_items: Extra widgets kept built above and below the
+                viewport to hide windowing during slow scrolls
+            scroll_changed_fn: Optional callback invoked with scroll_y
+                after the window updates; the list owns the frame's
+                scroll callback, so chaining goes through here
+        """
+        self._scroll_frame = scroll_frame
+        self._item_height = item_height
+        self._spacing = spacing
+        self._buffer = buffer_items
+        self._scroll_changed_fn = scroll_changed_fn
+        self._items: list = []
+        self._visible = (0, 0)
+        self._frame: ui.Frame = None
+        scroll_frame.set_scroll_y_changed_fn(self._on_scroll)
+
+    def build(self):
+        """Build the list container; call inside the scroll frame."""
+        self._frame = ui.Frame(height=0)
+        self._frame.set_build_fn(self._build_window)
+        self._frame.rebuild()
+
+    def append(self, item):
+        """Add a widget to the end of the list and refresh the window.
+
+        Args:
+            item: MessageWidget or ToolCallWidget to append
+        """
+        self._items.append(item)
+        self._update_window(force=True)
+
+    def clear(self):
+        """Remove all items and rebuild empty."""
+        for item in self._items:
+            item.release()
+        self._items.clear()
+        self._visible = (0, 0)
+        self._update_window(force=True)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _window_range(self) -> tuple:
+        """Compute the [i0, i1) item range intersecting the viewport."""
+        count = len(self._items)
+        if count == 0:
+            return (0, 0)
+        stride = self._item_height + self._spacing
+        top = self._scroll_frame.scroll_y or 0.0
+        viewport = self._scroll_frame.computed_height or 600.0
+        i0 = max(0, int(top // stride) - self._buffer)
+        i1 = min(count, int((top + viewport) // stride) + 1 + self._buffer)
+        return (i0, i1)
+
+    def _on_scroll(self, scroll_y: float):
+        self._update_window()
+        if self._scroll_changed_fn is not None:
+            self._scroll_changed_fn(scroll_y)
+
+    def _update_window(self, force: bool = False):
+        window = self._window_range()
+        if force or window != self._visible:
+            self._visible = window
+            if self._frame:
+                self._frame.rebuild()
+
+    def _build_window(self):
+        """Build spacer pads plus the visible widget slice."""
+        count = len(self._items)
+        i0, i1 = self._visible
+        stride = self._item_height + self._spacing
+        # Released widgets keep their content but drop label references,
+        # so streaming updates off-screen only touch the model
+        for item in self._items[:i0]:
+            item.release()
+        for item in self._items[i1:]:
+            item.release()
+        with ui.VStack(spacing=self._spacing, height=0):
+            if i0 > 0:
+                ui.Spacer(height=ui.Pixel(i0 * stride))
+            for item in self._items[i0:i1]:
+                item.build()
+            if i1 < count:
+                ui.Spacer(height=ui.Pixel((count - i1) * stride))
+
+
 class StatusIndicator:
     """Widget for displaying connection and processing status."""
 
@@ -238,7 +420,11 @@ class StatusIndicator:
         """Initialize status indicator."""
         self._status_label: ui.Label = None
         self._status_circle: ui.Circle = None
-        self._current_color = ui.color(0.5, 0.5, 0.5, 1.0)
+        self._circle_style = _STATUS_CIRCLE_IDLE
+        # Last applied (status, message); repeated identical updates
+        # (one per streamed token) early-return without touching the UI
+        self._current_status = None
+        self._current_message = None
 
     def build(self) -> ui.Frame:
         """Build the status indicator UI.
@@ -252,11 +438,11 @@ class StatusIndicator:
                 ui.Spacer(width=5)
                 self._status_circle = ui.Circle(
                     radius=5,
-                    style={"background_color": self._current_color}
+                    style=self._circle_style
                 )
                 self._status_label = ui.Label(
                     "Ready",
-                    style={"font_size": 16, "color": ui.color(0.8, 0.8, 0.8, 1.0)}
+                    style=_STATUS_LABEL_STYLE
                 )
                 ui.Spacer()
 
@@ -269,22 +455,19 @@ class StatusIndicator:
             status: Status type (ready, thinking, tool, error)
             message: Optional custom status message
         """
-        if status == "ready":
-            new_color = ui.color(0.3, 0.8, 0.3, 1.0)  # Green
-            default_msg = "Ready"
-        elif status == "thinking":
-            new_color = ui.color(0.8, 0.6, 0.2, 1.0)  # Orange
-            default_msg = "Thinking..."
-        elif status == "tool":
-            new_color = ui.color(0.5, 0.4, 0.8, 1.0)  # Purple
-            default_msg = "Using tool..."
-        else:  # error
-            new_color = ui.color(0.8, 0.2, 0.2, 1.0)  # Red
-            default_msg = "Error"
-
-        self._current_color = new_color
-        if self._status_circle:
-            self._status_circle.set_style({"background_color": new_color})
+        if status == self._current_status and message == self._current_message:
+            return
+        self._current_status = status
+        self._current_message = message
+
+        new_style = _STATUS_CIRCLE_STYLES.get(status) or _STATUS_CIRCLE_STYLES["error"]
+        default_msg = _STATUS_DEFAULT_MSG.get(status, "Error")
+
+        # Only re-resolve the circle style when the color actually changes
+        if new_style is not self._circle_style:
+            self._circle_style = new_style
+            if self._status_circle:
+                self._status_circle.set_style(new_style)
 
         if self._status_label:
             self._status_label.text = message if message else default_msg
@@ -1,20 +1,226 @@
 """USD and viewport tools exposed as MCP tools."""
 
+import asyncio
 import omni.usd
 from omni.kit.viewport.utility import get_active_viewport_camera_string
-from pxr import Gf, UsdGeom, Usd
+from pxr import Gf, Sdf, Tf, UsdGeom, Usd
 import carb
+import numpy as np
 from typing import Dict, Any, List, Optional
 
+# Hardware raycast against the renderer's acceleration structure, when
+# the platform provides it; the CPU slab path stays as the fallback
+try:
+    import omni.kit.raycast.query as _rtx_query
+except ImportError:
+    _rtx_query = None
+
+
+# Property edits that provably cannot move, resize, or re-type geometry:
+# shading/display attributes and material bindings. Everything else is
+# treated as geometry-affecting — an allow-list here would go stale the
+# moment a new schema attribute (radius, points, ...) shows up.
+_GEOMETRY_BENIGN_PROPS = frozenset({
+    "doubleSided", "orientation", "material:binding",
+})
+_GEOMETRY_BENIGN_PREFIXES = ("primvars:", "material:binding:", "proxyPrim")
+
+
+def _affects_geometry(notice) -> bool:
+    """Whether a change notice can move, resize, or re-type geometry.
+
+    Resyncs (prim add/remove/retype) always count. Info-only property
+    changes count unless the property is on the known-benign list of
+    shading/display attributes: geometry-defining attributes vary per
+    schema (radius on a Sphere, points on a Mesh, ...), so unknown names
+    conservatively invalidate rather than risk serving stale bounds.
+    """
+    if notice.GetResyncedPaths():
+        return True
+    for path in notice.GetChangedInfoOnlyPaths():
+        if not path.IsPropertyPath():
+            return True
+        name = path.name
+        if name in _GEOMETRY_BENIGN_PROPS or name.startswith(_GEOMETRY_BENIGN_PREFIXES):
+            continue
+        return True
+    return False
+
+
+class _SceneBounds:
+    """Cached world AABBs for the boundable prims of a stage.
+
+    Raycasts against an unchanged stage reuse the bounds from the last
+    call instead of re-traversing and re-computing every world bound.
+    A single BBoxCache computes all bounds in one pass on rebuild, and
+    a Usd.Notice.ObjectsChanged listener drops the cache whenever the
+    stage is edited.
+    """
+
+    def __init__(self):
+        self._stage = None
+        self._listener = None
+        self._entries = None
+        self._version = 0
+
+    def _on_objects_changed(self, notice, stage):
+        if self._entries is not None and _affects_geometry(notice):
+            self._entries = None
+            self._version += 1
+
+    def _ensure_stage(self, stage):
+        if stage is not self._stage:
+            if self._listener is not None:
+                self._listener.Revoke()
+            self._stage = stage
+            self._listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+            self._entries = None
+            self._version += 1
+
+    def get(self, stage) -> tuple:
+        """Get (prims, mins, maxs) for the stage's boundables.
+
+        prims is a list of N prims; mins/maxs are (N, 3) float64 arrays
+        of the matching world AABB corners, ready for vectorized math.
+        """
+        self._ensure_stage(stage)
+        if self._entries is None:
+            self._entries = self._build(stage)
+        return self._entries
+
+    def version(self, stage) -> int:
+        """Monotonic token, bumped whenever cached geometry may change."""
+        self._ensure_stage(stage)
+        return self._version
+
+    @staticmethod
+    def _build(stage) -> tuple:
+        # BBoxCache shares one internal xform cache across the whole
+        # pass, unlike per-prim ComputeWorldBound; extents hints let it
+        # read authored bounds instead of walking geometry
+        bbox_cache = UsdGeom.BBoxCache(
+            Usd.TimeCode.Default(), ["default", "render"], useExtentsHint=True
+        )
+        prims = []
+        mins = []
+        maxs = []
+        # Traverse instance proxies so instanced geometry is hittable;
+        # prune system subtrees instead of testing every descendant
+        prim_range = Usd.PrimRange(
+            stage.GetPseudoRoot(), Usd.TraverseInstanceProxies()
+        )
+        it = iter(prim_range)
+        for prim in it:
+            if prim.GetName().startswith('OmniverseKit_'):
+                it.PruneChildren()
+                continue
+            if not prim.IsA(UsdGeom.Boundable):
+                continue
+            box = bbox_cache.ComputeWorldBound(prim).ComputeAlignedBox()
+            if box.IsEmpty():
+                continue
+            mn = box.GetMin()
+            mx = box.GetMax()
+            prims.append(prim)
+            mins.append((mn[0], mn[1], mn[2]))
+            maxs.append((mx[0], mx[1], mx[2]))
+        return (
+            prims,
+            np.array(mins, dtype=np.float64).reshape(len(prims), 3),
+            np.array(maxs, dtype=np.float64).reshape(len(prims), 3),
+        )
+
+
+class _StageXformCache:
+    """Shared UsdGeom.XformCache, cleared when the stage changes.
+
+    XformCache memoizes local-to-world matrices; constructing a fresh
+    one per call threw that memoization away. One instance now persists
+    across calls, cleared by a Usd.Notice.ObjectsChanged listener.
+    """
+
+    def __init__(self):
+        self._stage = None
+        self._listener = None
+        self._cache = None
+
+    def _on_objects_changed(self, notice, stage):
+        if self._cache is not None and _affects_geometry(notice):
+            self._cache.Clear()
+
+    def get(self, stage) -> UsdGeom.XformCache:
+        """Get the cache for the stage, swapping it on stage change."""
+        if stage is not self._stage:
+            if self._listener is not None:
+                self._listener.Revoke()
+            self._stage = stage
+            self._listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+            self._cache = UsdGeom.XformCache()
+        return self._cache
+
+
+# Shared across tool calls; invalidated lazily after stage edits
+_scene_bounds = _SceneBounds()
+_stage_xforms = _StageXformCache()
+
+def _as_vec(attr):
+    value = attr.Get()
+    return None if value is None else tuple(value)
+
+
+def _as_token(attr):
+    value = attr.Get()
+    return None if value is None else str(value)
+
+
+def _as_color_array(attr):
+    value = attr.Get()
+    return None if value is None else [tuple(c) for c in value]
+
+
+# Raycast results keyed by (pose, max_distance, scene version); agent
+# turns often repeat the exact same query back to back
+_raycast_memo: Dict[tuple, Dict[str, Any]] = {}
+_RAYCAST_MEMO_MAX = 64
+
+# Prim type names accepted by create_prim, bound to their schema
+# classes once at import instead of per call
+_PRIM_TYPE_MAP = {
+    "Cube": UsdGeom.Cube,
+    "Sphere": UsdGeom.Sphere,
+    "Cylinder": UsdGeom.Cylinder,
+    "Cone": UsdGeom.Cone,
+    "Xform": UsdGeom.Xform
+}
+
+# Attributes surfaced by get_prim_info, each paired with a converter
+# returning JSON-friendly primitives instead of str(Gf...) repr text
+_INFO_ATTR_GETTERS = {
+    "xformOp:translate": _as_vec,
+    "xformOp:rotateXYZ": _as_vec,
+    "xformOp:scale": _as_vec,
+    "visibility": _as_token,
+    "purpose": _as_token,
+    "displayColor": _as_color_array,
+}
+
 
 class USDTools:
     """Collection of USD manipulation and query tools."""
 
     @staticmethod
-    def raycast_from_camera(max_distance: float = 1000.0) -> Dict[str, Any]:
+    async def raycast_from_camera(max_distance: float = 1000.0) -> Dict[str, Any]:
         """
         Perform raycast from camera center to find the prim in view.
 
+        Uses the renderer's RTX raycast query when available (true
+        triangle-level hits); falls back to the CPU bounds test when
+        the interface is missing or reports nothing.
+
         Args:
             max_distance: Maximum raycast distance
 
@@ -35,49 +241,137 @@ class USDTools:
             if not camera_prim.IsValid():
                 return {"success": False, "error": "No valid camera found"}
 
-            # Get camera transform
-            xformAPI = UsdGeom.XformCache()
-            camera_matrix = xformAPI.GetLocalToWorldTransform(camera_prim)
+            # Get camera transform (shared cache, cleared on stage edits)
+            camera_matrix = _stage_xforms.get(stage).GetLocalToWorldTransform(camera_prim)
 
-            # Camera position and direction
+            # Camera position and direction. The world-space -Z axis is
+            # the negated third row of the row-vector matrix, so no
+            # temporary vector transform is needed; normalization only
+            # fires when the camera xform bakes in scale
             ray_origin = camera_matrix.ExtractTranslation()
-            ray_direction = camera_matrix.TransformDir(Gf.Vec3d(0, 0, -1)).GetNormalized()
-            ray = Gf.Ray(ray_origin, ray_direction)
+            row = camera_matrix.GetRow3(2)
+            ray_direction = Gf.Vec3d(-row[0], -row[1], -row[2])
+            length_sq = Gf.Dot(ray_direction, ray_direction)
+            if abs(length_sq - 1.0) > 1e-9:
+                ray_direction = ray_direction / (length_sq ** 0.5)
+
+            # Same pose against an unchanged scene returns the memoized
+            # result; the version component makes stale hits impossible
+            memo_key = (
+                round(ray_origin[0], 4), round(ray_origin[1], 4),
+                round(ray_origin[2], 4),
+                round(ray_direction[0], 6), round(ray_direction[1], 6),
+                round(ray_direction[2], 6),
+                max_distance,
+                _scene_bounds.version(stage),
+            )
+            result = _raycast_memo.get(memo_key)
+            if result is not None:
+                return result
+
+            if _rtx_query is not None:
+                result = await USDTools._raycast_rtx(
+                    stage, ray_origin, ray_direction, max_distance
+                )
+            if result is None:
+                result = USDTools._raycast_cpu(
+                    stage, ray_origin, ray_direction, max_distance
+                )
+
+            if len(_raycast_memo) >= _RAYCAST_MEMO_MAX:
+                _raycast_memo.clear()
+            _raycast_memo[memo_key] = result
+            return result
 
-            # Find closest intersecting prim
-            closest_prim = None
-            closest_distance = max_distance
+        except Exception as e:
+            carb.log_error(f"Raycast error: {e}")
+            return {"success": False, "error": str(e)}
 
-            for prim in stage.Traverse():
-                # Skip non-geometric prims
-                if not prim.IsA(UsdGeom.Imageable):
-                    continue
-                if prim.GetName().startswith('OmniverseKit_'):
-                    continue
+    @staticmethod
+    async def _raycast_rtx(stage, ray_origin, ray_direction, max_distance) -> Optional[Dict[str, Any]]:
+        """Submit a hardware raycast; None means unavailable or no hit."""
+        try:
+            iface = _rtx_query.acquire_raycast_query_interface()
+        except Exception:
+            return None
+        if iface is None:
+            return None
+
+        future = asyncio.get_event_loop().create_future()
+
+        def _on_result(ray, result):
+            if future.done():
+                return
+            if not result.valid:
+                future.set_result(None)
+                return
+            path = str(result.get_target_usd_path())
+            prim = stage.GetPrimAtPath(path)
+            hit_pos = Gf.Vec3d(*result.hit_position)
+            distance = (hit_pos - ray_origin).GetLength()
+            if distance > max_distance:
+                future.set_result(None)
+                return
+            future.set_result({
+                "success": True,
+                "prim_path": path,
+                "prim_name": prim.GetName() if prim.IsValid() else path.rsplit("/", 1)[-1],
+                "prim_type": prim.GetTypeName() if prim.IsValid() else "",
+                "distance": distance
+            })
 
-                # Check bounding box intersection
-                if prim.IsA(UsdGeom.Boundable):
-                    bound = UsdGeom.Boundable(prim).ComputeWorldBound(
-                        Usd.TimeCode.Default(), "default"
-                    )
-                    bbox = bound.GetBox()
+        try:
+            ray = _rtx_query.Ray(
+                (ray_origin[0], ray_origin[1], ray_origin[2]),
+                (ray_direction[0], ray_direction[1], ray_direction[2])
+            )
+            iface.submit_raycast_query(ray, _on_result)
+        except Exception as e:
+            carb.log_warn(f"RTX raycast unavailable: {e}")
+            return None
 
-                    if not bbox.IsEmpty():
-                        intersection = bbox.ComputeNearestPoint(ray_origin)
-                        distance = (intersection - ray_origin).GetLength()
+        try:
+            return await asyncio.wait_for(future, timeout=1.0)
+        except asyncio.TimeoutError:
+            return None
 
-                        # Check if ray passes through bbox
-                        ray_to_box = (intersection - ray_origin).GetNormalized()
-                        dot_product = Gf.Dot(ray_to_box, ray_direction)
+    @staticmethod
+    def _raycast_cpu(stage, ray_origin, ray_direction, max_distance) -> Dict[str, Any]:
+        """CPU fallback: slab test against the cached scene bounds."""
+        try:
+            # Exact ray/AABB slab test against the cached scene bounds,
+            # vectorized over all boxes at once; the bounds survive
+            # across calls until the stage changes
+            closest_prim = None
+            closest_distance = max_distance
 
-                        if dot_product > 0.9 and distance < closest_distance:
-                            closest_distance = distance
-                            closest_prim = prim
+            prims, box_min, box_max = _scene_bounds.get(stage)
+            if prims:
+                origin = np.array(
+                    (ray_origin[0], ray_origin[1], ray_origin[2]), dtype=np.float64
+                )
+                direction = np.array(
+                    (ray_direction[0], ray_direction[1], ray_direction[2]),
+                    dtype=np.float64
+                )
+                # Axis-parallel rays divide by zero into +-inf, which the
+                # slab comparisons below handle correctly
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t1 = (box_min - origin) / direction
+                    t2 = (box_max - origin) / direction
+                tnear = np.maximum(np.minimum(t1, t2).max(axis=1), 0.0)
+                tfar = np.maximum(t1, t2).min(axis=1)
+                hit = (tfar >= tnear) & (tnear < max_distance)
+                if hit.any():
+                    tnear = np.where(hit, tnear, np.inf)
+                    idx = int(tnear.argmin())
+                    closest_distance = float(tnear[idx])
+                    closest_prim = prims[idx]
 
             if closest_prim:
                 return {
                     "success": True,
-                    "prim_path": str(closest_prim.GetPath()),
+                    "prim_path": closest_prim.GetPath().pathString,
                     "prim_name": closest_prim.GetName(),
                     "prim_type": closest_prim.GetTypeName(),
                     "distance": closest_distance
@@ -107,15 +401,19 @@ class USDTools:
             if not selected_paths:
                 return {"success": True, "selected_prims": []}
 
-            prims_info = []
-            for path in selected_paths:
-                prim = stage.GetPrimAtPath(path)
-                if prim.IsValid():
-                    prims_info.append({
-                        "path": str(prim.GetPath()),
-                        "name": prim.GetName(),
-                        "type": prim.GetTypeName()
-                    })
+            # Selection paths come from the stage, so prims are valid
+            # except for a brief window after deletion; the truthiness
+            # check covers that without a per-prim IsValid() call
+            get_prim = stage.GetPrimAtPath
+            prims_info = [
+                {
+                    "path": prim.GetPath().pathString,
+                    "name": prim.GetName(),
+                    "type": prim.GetTypeName()
+                }
+                for prim in map(get_prim, selected_paths)
+                if prim
+            ]
 
             return {"success": True, "selected_prims": prims_info}
 
@@ -143,18 +441,20 @@ class USDTools:
             if not prim.IsValid():
                 return {"success": False, "error": f"Prim not found: {prim_path}"}
 
-            # Get attributes
+            # Targeted lookups: GetAttribute is a hash lookup, so a
+            # Shader/Material prim with hundreds of attributes doesn't
+            # materialize a wrapper per attribute we never report
             attributes = {}
-            for attr in prim.GetAttributes():
-                attr_name = attr.GetName()
-                # Only include commonly useful attributes
-                if attr_name in ["xformOp:translate", "xformOp:rotateXYZ", "xformOp:scale",
-                                "visibility", "purpose", "displayColor"]:
-                    attributes[attr_name] = str(attr.Get())
+            for attr_name, getter in _INFO_ATTR_GETTERS.items():
+                attr = prim.GetAttribute(attr_name)
+                if attr and attr.HasAuthoredValue():
+                    value = getter(attr)
+                    if value is not None:
+                        attributes[attr_name] = value
 
             return {
                 "success": True,
-                "path": str(prim.GetPath()),
+                "path": prim.GetPath().pathString,
                 "name": prim.GetName(),
                 "type": prim.GetTypeName(),
                 "attributes": attributes
@@ -182,12 +482,13 @@ class USDTools:
             if not camera_prim.IsValid():
                 return {"success": False, "error": "No valid camera found"}
 
-            # Get camera transform
-            xformAPI = UsdGeom.XformCache()
-            camera_matrix = xformAPI.GetLocalToWorldTransform(camera_prim)
+            # Get camera transform (shared cache, cleared on stage edits)
+            camera_matrix = _stage_xforms.get(stage).GetLocalToWorldTransform(camera_prim)
 
             position = camera_matrix.ExtractTranslation()
-            direction = camera_matrix.TransformDir(Gf.Vec3d(0, 0, -1))
+            # Negated third matrix row: the camera -Z axis in world space
+            row = camera_matrix.GetRow3(2)
+            direction = Gf.Vec3d(-row[0], -row[1], -row[2])
 
             return {
                 "success": True,
@@ -217,20 +518,11 @@ class USDTools:
             ctx = omni.usd.get_context()
             stage = ctx.get_stage()
 
-            # Map common names to UsdGeom types
-            type_map = {
-                "Cube": UsdGeom.Cube,
-                "Sphere": UsdGeom.Sphere,
-                "Cylinder": UsdGeom.Cylinder,
-                "Cone": UsdGeom.Cone,
-                "Xform": UsdGeom.Xform
-            }
-
-            if prim_type not in type_map:
+            prim_class = _PRIM_TYPE_MAP.get(prim_type)
+            if prim_class is None:
                 return {"success": False, "error": f"Unknown prim type: {prim_type}"}
 
             # Create prim
-            prim_class = type_map[prim_type]
             new_prim = prim_class.Define(stage, prim_path)
 
             # Set position if provided
@@ -240,7 +532,7 @@ class USDTools:
 
             return {
                 "success": True,
-                "prim_path": str(new_prim.GetPath()),
+                "prim_path": new_prim.GetPath().pathString,
                 "message": f"Created {prim_type} at {prim_path}"
             }
 
@@ -249,15 +541,79 @@ class USDTools:
             return {"success": False, "error": str(e)}
 
     @staticmethod
-    def list_all_prims(root_path: str = "/") -> Dict[str, Any]:
+    def create_prims(specs: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        List all prims under a given root path.
+        Create several prims in one batch.
+
+        All edits happen inside one Sdf.ChangeBlock, so the stage
+        recomposes and notifies listeners once for the whole batch
+        instead of once per prim.
+
+        Args:
+            specs: List of dicts with prim_type, prim_path, and
+                optional position (as accepted by create_prim)
+
+        Returns:
+            Dict with created prim paths and any per-spec errors
+        """
+        try:
+            ctx = omni.usd.get_context()
+            stage = ctx.get_stage()
+
+            created = []
+            errors = []
+            with Sdf.ChangeBlock():
+                for spec in specs:
+                    prim_type = spec.get("prim_type")
+                    prim_path = spec.get("prim_path")
+                    prim_class = _PRIM_TYPE_MAP.get(prim_type)
+                    if prim_class is None or not prim_path:
+                        errors.append(f"Invalid spec: {prim_type} at {prim_path}")
+                        continue
+
+                    new_prim = prim_class.Define(stage, prim_path)
+
+                    position = spec.get("position")
+                    if position and len(position) == 3:
+                        xformable = UsdGeom.Xformable(new_prim)
+                        xformable.AddTranslateOp().Set(
+                            Gf.Vec3d(position[0], position[1], position[2])
+                        )
+
+                    created.append(new_prim.GetPath().pathString)
+
+            return {
+                "success": not errors,
+                "created": created,
+                "count": len(created),
+                "errors": errors
+            }
+
+        except Exception as e:
+            carb.log_error(f"Create prims error: {e}")
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def list_all_prims(
+        root_path: str = "/",
+        max_results: int = 1000,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List prims under a given root path, one page at a time.
+
+        Bounding the page size keeps memory and response latency flat
+        on large stages; callers follow next_cursor for the rest.
 
         Args:
             root_path: Root USD path to start listing from
+            max_results: Maximum prims per page
+            cursor: next_cursor value from a previous page, to resume
+                after the last prim already returned
 
         Returns:
-            Dict with list of prim paths and types
+            Dict with one page of prims and a next_cursor when more
+            prims remain
         """
         try:
             ctx = omni.usd.get_context()
@@ -268,13 +624,30 @@ class USDTools:
                 return {"success": False, "error": f"Invalid root path: {root_path}"}
 
             prims = []
-            for prim in Usd.PrimRange(root_prim):
-                # Skip system prims
+            append = prims.append
+            skipping = cursor is not None
+            truncated = False
+            it = iter(Usd.PrimRange(root_prim))
+            for prim in it:
+                # Skip system prims and their whole subtrees
                 if prim.GetName().startswith('OmniverseKit_'):
+                    it.PruneChildren()
                     continue
 
-                prims.append({
-                    "path": str(prim.GetPath()),
+                path = prim.GetPath().pathString
+                if skipping:
+                    # Fast-forward in traversal order to the cursor;
+                    # listing resumes on the prim after it
+                    if path == cursor:
+                        skipping = False
+                    continue
+
+                if len(prims) >= max_results:
+                    truncated = True
+                    break
+
+                append({
+                    "path": path,
                     "name": prim.GetName(),
                     "type": prim.GetTypeName()
                 })
@@ -282,7 +655,8 @@ class USDTools:
             return {
                 "success": True,
                 "prims": prims,
-                "count": len(prims)
+                "count": len(prims),
+                "next_cursor": prims[-1]["path"] if truncated and prims else None
             }
 
         except Exception as e: